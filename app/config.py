@@ -1,10 +1,9 @@
 """Application configuration loaded from config.yml."""
 
-from pathlib import Path
 from dataclasses import dataclass, field
+from pathlib import Path
 
-import yaml
-
+from app.yaml_compat import SafeLoader
 
 BASE_DIR = Path(__file__).parent.parent
 CONFIG_FILE = BASE_DIR / "config.yml"
@@ -13,21 +12,27 @@ INPUT_DIR = DATA_DIR / "input"
 OUTPUT_DIR = DATA_DIR / "output"
 LOGS_DIR = DATA_DIR / "logs"
 HISTORY_FILE = DATA_DIR / "history.json"
+JINJA_CACHE_DIR = DATA_DIR / "jinja_cache"
+PREVIEW_DIR = DATA_DIR / "previews"
 
 INPUT_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
+JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     host: str = "0.0.0.0"
     port: int = 8000
     version: str = "0.1.0"
-    reload: bool = True
+    # Dev mode (uvicorn reload, template auto-reload, no render caches).
+    # Off by default so deployments without a config.yml run in production
+    # mode; the repo's config.yml turns it on for local development.
+    reload: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     rotation: str = "10 MB"
     retention: str = "7 days"
@@ -35,32 +40,35 @@ class LoggingConfig:
     file_level: str = "DEBUG"
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryConfig:
     max_entries: int = 50
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadConfig:
     max_download_size: str = "0.5gb"
     filename_max_length: int = 50
     format: str = "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfig:
     allowed_extensions: list[str] = field(default_factory=lambda: [
         ".mp4", ".mkv", ".avi", ".mov", ".webm",
         ".mp3", ".wav", ".flac", ".m4a", ".ogg"
     ])
     preview_timeout: int = 30
+    # Cap on ffmpeg runs started by requests at once. None means half the
+    # CPUs available to the process, worked out when the server starts.
+    max_concurrent_ffmpeg: int | None = None
     mp3_quality: str = "4"
     default_preset: str = "none"
     default_start_time: str = "00:00:00"
     default_end_time: str = "00:00:06"
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     server: ServerConfig = field(default_factory=ServerConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
@@ -74,8 +82,12 @@ def load_config() -> AppConfig:
     if not CONFIG_FILE.exists():
         return AppConfig()
 
-    with open(CONFIG_FILE) as f:
-        data = yaml.safe_load(f) or {}
+    # Hand libyaml the raw bytes so it does the UTF-8 decode in one pass
+    loader = SafeLoader(CONFIG_FILE.read_bytes())
+    try:
+        data = loader.get_single_data() or {}
+    finally:
+        loader.dispose()
 
     return AppConfig(
         server=ServerConfig(**data.get("server", {})),
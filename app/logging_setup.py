@@ -0,0 +1,88 @@
+"""Loguru configuration and standard-logging interception."""
+
+import inspect
+import logging
+import sys
+from functools import lru_cache
+
+from loguru import logger
+
+from app.config import LOGS_DIR, config
+
+# Std-logging level name -> loguru level (name, or levelno if unknown)
+_LEVEL_CACHE: dict[str, str | int] = {}
+
+# (pathname, lineno) of a std-logging call site -> loguru depth of its frame
+_DEPTH_CACHE: dict[tuple[str, int], int] = {}
+
+# Lowest level any loguru sink accepts; set once the sinks are added
+_min_sink_level = 0
+
+
+class InterceptHandler(logging.Handler):
+    """Intercept standard logging and route to loguru."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Skip the frame walk and message formatting for records no sink keeps
+        if record.levelno < _min_sink_level:
+            return
+
+        level = _LEVEL_CACHE.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            _LEVEL_CACHE[record.levelname] = level
+
+        # The stack between a call site and this handler is the same every
+        # time, so walk it once per site and reuse the depth
+        site = (record.pathname, record.lineno)
+        depth = _DEPTH_CACHE.get(site)
+        if depth is None:
+            frame, depth = inspect.currentframe(), 0
+            while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+                frame = frame.f_back
+                depth += 1
+            _DEPTH_CACHE[site] = depth
+
+        logger.opt(depth=depth, exception=record.exc_info).log(
+            level, record.getMessage()
+        )
+
+
+@lru_cache(maxsize=1)
+def configure_logging() -> None:
+    """Configure loguru sinks and route standard logging through them.
+
+    Runs once per process; later calls (re-imports, tests) are no-ops, so
+    the file sink is not reopened and handlers are not reinstalled.
+    """
+    global _min_sink_level
+
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
+        level=config.logging.stderr_level,
+    )
+    logger.add(
+        LOGS_DIR / "app.log",
+        rotation=config.logging.rotation,
+        retention=config.logging.retention,
+        level=config.logging.file_level,
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        # Write (and rotate) on loguru's worker thread, off the request path
+        enqueue=True,
+    )
+    _min_sink_level = min(
+        logger.level(config.logging.stderr_level).no,
+        logger.level(config.logging.file_level).no,
+    )
+
+    # Intercept uvicorn and other standard loggers
+    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    for name in ["uvicorn", "uvicorn.error", "uvicorn.access", "fastapi"]:
+        log = logging.getLogger(name)
+        log.handlers = [InterceptHandler()]
+        log.propagate = False
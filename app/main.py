@@ -1,252 +1,340 @@
 """FastAPI application entry point."""
 
-import logging
+import asyncio
+import mimetypes
 import os
+import stat
 import subprocess
-import sys
-
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+import zlib
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import anyio
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from loguru import logger
+from starlette.datastructures import Headers, QueryParams
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
 
-from app.config import INPUT_DIR, OUTPUT_DIR, LOGS_DIR, config
-from app.models import PRESETS, PresetLevel
+from app.config import BASE_DIR, INPUT_DIR, config
+from app.logging_setup import configure_logging
 from app.routers import audio, history, download
 from app.services import get_input_files
 from app.services.settings import load_user_settings
 from app.services.presets import (
-    load_presets,
-    get_volume_presets,
-    get_tunnel_presets,
-    get_frequency_presets,
-    get_speed_presets,
-    get_pitch_presets,
-    get_noise_reduction_presets,
-    get_compressor_presets,
-    get_brightness_presets,
-    get_contrast_presets,
-    get_saturation_presets,
-    get_blur_presets,
-    get_sharpen_presets,
-    get_transform_presets,
+    get_category_presets,
+    resolve_current_presets,
 )
+from app.services.presets_themes import get_video_theme_presets, get_audio_theme_presets
+from app.templating import templates
+
+
+@lru_cache(maxsize=64)
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (honouring q=0)."""
+    wildcard_q = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard_q = q
+    return wildcard_q is not None and wildcard_q > 0
+
+
+class CachedStaticFiles(StaticFiles):
+    """Static files with long-lived caching and precompressed .gz siblings.
+
+    Outside dev mode, URLs carrying the ?v=<cache_version> query are
+    immutable for a deploy, so they get a one-year Cache-Control. When the
+    client accepts gzip and a ``<file>.gz`` exists (built in the Docker
+    image), it is served instead. The .gz siblings are never served directly.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if path.endswith(".gz"):
+            raise HTTPException(status_code=404)
+
+        response = None
+        request_headers = Headers(scope=scope)
+        if _accepts_gzip(request_headers.get("accept-encoding", "")):
+            response = await self._get_gzip_response(path, scope, request_headers)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        response.headers["Vary"] = "Accept-Encoding"
+        # In dev mode ?v= is the commit hash, which doesn't change on edits
+        if not config.server.reload and "v" in QueryParams(scope["query_string"]):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+    async def _get_gzip_response(
+        self, path: str, scope: Scope, request_headers: Headers
+    ) -> Response | None:
+        """Get a response for the .gz sibling of path, or None if there isn't one."""
+        if scope["method"] not in ("GET", "HEAD"):
+            return None
 
-
-class InterceptHandler(logging.Handler):
-    """Intercept standard logging and route to loguru."""
-
-    def emit(self, record: logging.LogRecord) -> None:
         try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
-
-        logger.opt(depth=depth, exception=record.exc_info).log(
-            level, record.getMessage()
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + ".gz")
+        except OSError:
+            return None
+        if not (stat_result and stat.S_ISREG(stat_result.st_mode)):
+            return None
+
+        response = FileResponse(
+            full_path,
+            stat_result=stat_result,
+            media_type=mimetypes.guess_type(path)[0] or "text/plain",
+            headers={"Content-Encoding": "gzip"},
         )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
 
 
-# Configure loguru
-logger.remove()
-logger.add(
-    sys.stderr,
-    format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-    level=config.logging.stderr_level,
-)
-logger.add(
-    LOGS_DIR / "app.log",
-    rotation=config.logging.rotation,
-    retention=config.logging.retention,
-    level=config.logging.file_level,
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-)
+# Configure loguru and intercept uvicorn and other standard loggers
+configure_logging()
+logger.info("Audio Processor starting up")
 
-# Intercept uvicorn and other standard loggers
-logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
-for name in ["uvicorn", "uvicorn.error", "uvicorn.access", "fastapi"]:
-    log = logging.getLogger(name)
-    log.handlers = [InterceptHandler()]
-    log.propagate = False
+# Presets (presets.yml) and theme presets (presets_themes.yml) are loaded
+# on first use by their get_* accessors, so /health never waits on YAML
 
-logger.info("Audio Processor starting up")
 
-# Load presets from YAML file
-load_presets()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Clear preview files left by a previous run, and ours on shutdown."""
+    audio.preview_cache.clear()
+    yield
+    audio.preview_cache.clear()
 
-# Load theme presets (VHS, Vinyl, etc.)
-from app.services.presets_themes import load_theme_presets
-load_theme_presets()
 
 app = FastAPI(
     title="Audio Processor",
     description="Extract and process audio with tunnel effects",
     version=config.server.version,
+    lifespan=lifespan,
 )
 
 # Mount static files
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+app.mount("/static", CachedStaticFiles(directory="app/static"), name="static")
 
 # Include routers
 app.include_router(audio.router)
 app.include_router(history.router)
 app.include_router(download.router)
 
-templates = Jinja2Templates(directory="app/templates")
+def _read_git_head(git_dir: Path = BASE_DIR / ".git") -> tuple[str, str] | None:
+    """Read (short hash, commit date) of HEAD straight from the .git directory.
 
-
-def get_git_hash() -> str:
-    """Get current git commit short hash for cache busting."""
-    # Check environment variable first (set at Docker build time)
+    Handles loose refs, packed-refs and loose commit objects. Returns None
+    when anything else is needed (packed objects, worktrees), so the
+    caller can fall back to running git.
+    """
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            ref = head[5:]
+            ref_path = git_dir / ref
+            if ref_path.is_file():
+                sha = ref_path.read_text().strip()
+            else:
+                sha = ""
+                for line in (git_dir / "packed-refs").read_text().splitlines():
+                    if line.endswith(f" {ref}"):
+                        sha = line.split(" ", 1)[0]
+                        break
+        else:
+            sha = head
+        if len(sha) != 40:
+            return None
+
+        obj_path = git_dir / "objects" / sha[:2] / sha[2:]
+        commit = zlib.decompress(obj_path.read_bytes())
+    except (OSError, zlib.error):
+        return None
+
+    for line in commit.split(b"\n"):
+        if line.startswith(b"committer "):
+            # committer <name> <<email>> <timestamp> <+hhmm>
+            timestamp, offset = line.rsplit(b" ", 2)[1:]
+            sign = -1 if offset.startswith(b"-") else 1
+            tz = timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5])))
+            date = datetime.fromtimestamp(int(timestamp), tz)
+            return sha[:7], date.strftime("%Y.%m.%d")
+    return None
+
+
+@lru_cache(maxsize=1)
+def _get_git_info() -> tuple[str, str]:
+    """Get (short hash, commit date) of the running checkout.
+
+    Values set at Docker build time (GIT_HASH/GIT_DATE) take precedence.
+    For whichever is missing (local development), HEAD is read from .git
+    directly, and git is only run if that fails.
+    """
     env_hash = os.environ.get("GIT_HASH", "")
-    if env_hash and env_hash != "dev":
-        return env_hash
-    # Fall back to git command (for local development)
+    git_hash = env_hash if env_hash and env_hash != "dev" else ""
+    git_date = os.environ.get("GIT_DATE", "")
+    if git_hash and git_date:
+        return git_hash, git_date
+
+    head = _read_git_head()
+    if head:
+        return git_hash or head[0], git_date or head[1]
+
     try:
         result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
+            ["git", "log", "-1", "--format=%h|%cd", "--date=format:%Y.%m.%d"],
             capture_output=True,
             text=True,
             timeout=5,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
+        if result.returncode == 0 and "|" in result.stdout:
+            log_hash, log_date = result.stdout.strip().split("|", 1)
+            git_hash = git_hash or log_hash
+            git_date = git_date or log_date
     except Exception:
         pass
-    return "dev"
+    return git_hash or "dev", git_date
+
+
+def get_git_hash() -> str:
+    """Get current git commit short hash for cache busting."""
+    return _get_git_info()[0]
 
 
 def get_git_commit_date() -> str:
     """Get current git commit date in yyyy.mm.dd format."""
-    # Check environment variable first (set at Docker build time)
-    env_date = os.environ.get("GIT_DATE", "")
-    if env_date:
-        return env_date
-    # Fall back to git command (for local development)
-    try:
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%cd", "--date=format:%Y.%m.%d"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except Exception:
-        pass
-    return ""
+    return _get_git_info()[1]
 
 
 # Cache bust version (computed once at startup)
 CACHE_VERSION = get_git_hash()
 COMMIT_DATE = get_git_commit_date()
-templates.env.globals["cache_version"] = CACHE_VERSION
-templates.env.globals["commit_hash"] = CACHE_VERSION
-templates.env.globals["commit_date"] = COMMIT_DATE
+templates.env.globals.update({
+    "cache_version": CACHE_VERSION,
+    "commit_hash": CACHE_VERSION,
+    "commit_date": COMMIT_DATE,
+})
 logger.info(f"Version: {COMMIT_DATE} ({CACHE_VERSION})")
 
 
+# Preset-only portion of the index context, rebuilt when presets are reloaded
+_index_static_context: dict[str, Any] = {}
+_index_static_source: dict[str, dict[str, Any]] | None = None
+
+
+def _get_index_static_context(category_presets: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Get the {category}_shortcuts entries of the index context."""
+    global _index_static_context, _index_static_source
+
+    if category_presets is not _index_static_source:
+        _index_static_context = {
+            f"{category}_shortcuts": presets
+            for category, presets in category_presets.items()
+        }
+        _index_static_source = category_presets
+    return _index_static_context
+
+
+# Rendered index pages for requests with no input files, keyed by base URL
+# and settings. Only used when templates are not reloaded (production).
+_INDEX_BODY_CACHE_SIZE = 16
+_index_body_cache: dict[tuple[str, str], str] = {}
+_index_body_sources: tuple[Any, ...] = ()
+
+
+def _get_index_body_cache(sources: tuple[Any, ...]) -> dict[tuple[str, str], str]:
+    """Get the rendered index cache, cleared when any preset source is reloaded."""
+    global _index_body_sources
+
+    if len(sources) != len(_index_body_sources) or any(
+        new is not old for new, old in zip(sources, _index_body_sources, strict=True)
+    ):
+        _index_body_cache.clear()
+        _index_body_sources = sources
+    elif len(_index_body_cache) >= _INDEX_BODY_CACHE_SIZE:
+        _index_body_cache.clear()
+    return _index_body_cache
+
+
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Main page with audio processor form."""
-    input_files = get_input_files(INPUT_DIR)
+    input_files = await asyncio.to_thread(get_input_files, INPUT_DIR)
     user_settings = load_user_settings()
 
-    # Get shortcut dictionaries from YAML
-    volume_shortcuts = get_volume_presets()
-    tunnel_shortcuts = get_tunnel_presets()
-    frequency_shortcuts = get_frequency_presets()
-    speed_shortcuts = get_speed_presets()
-    pitch_shortcuts = get_pitch_presets()
-    noise_reduction_shortcuts = get_noise_reduction_presets()
-    compressor_shortcuts = get_compressor_presets()
-    brightness_shortcuts = get_brightness_presets()
-    contrast_shortcuts = get_contrast_presets()
-    saturation_shortcuts = get_saturation_presets()
-    blur_shortcuts = get_blur_presets()
-    sharpen_shortcuts = get_sharpen_presets()
-    transform_shortcuts = get_transform_presets()
+    # Get shortcut dictionaries from YAML and the current config per category
+    category_presets = get_category_presets()
+    current_presets = resolve_current_presets(user_settings, category_presets)
 
     # Get theme presets for Presets tab
-    from app.services.presets_themes import get_video_theme_presets, get_audio_theme_presets
     video_theme_presets = get_video_theme_presets()
     audio_theme_presets = get_audio_theme_presets()
 
-    # Get current shortcut configs for initial panel render (with fallbacks)
-    volume_current = volume_shortcuts.get(user_settings.volume.preset) or volume_shortcuts.get("none")
-    tunnel_current = tunnel_shortcuts.get(user_settings.tunnel.preset) or tunnel_shortcuts.get("none")
-    frequency_current = frequency_shortcuts.get(user_settings.frequency.preset) or frequency_shortcuts.get("none")
-    speed_current = speed_shortcuts.get(user_settings.speed.preset) or speed_shortcuts.get("none")
-    pitch_current = pitch_shortcuts.get(user_settings.pitch.preset) or pitch_shortcuts.get("none")
-    noise_reduction_current = noise_reduction_shortcuts.get(user_settings.noise_reduction.preset) or noise_reduction_shortcuts.get("none")
-    compressor_current = compressor_shortcuts.get(user_settings.compressor.preset) or compressor_shortcuts.get("none")
-    brightness_current = brightness_shortcuts.get(user_settings.brightness.preset) or brightness_shortcuts.get("none")
-    contrast_current = contrast_shortcuts.get(user_settings.contrast.preset) or contrast_shortcuts.get("none")
-    saturation_current = saturation_shortcuts.get(user_settings.saturation.preset) or saturation_shortcuts.get("none")
-    blur_current = blur_shortcuts.get(user_settings.blur.preset) or blur_shortcuts.get("none")
-    sharpen_current = sharpen_shortcuts.get(user_settings.sharpen.preset) or sharpen_shortcuts.get("none")
-    transform_current = transform_shortcuts.get(user_settings.transform.preset) or transform_shortcuts.get("none")
-
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "input_files": input_files,
-            # Effect chain data
-            "user_settings": user_settings,
-            "current_filename": None,  # No file selected on initial load
-            # Audio effect shortcuts
-            "volume_shortcuts": volume_shortcuts,
-            "tunnel_shortcuts": tunnel_shortcuts,
-            "frequency_shortcuts": frequency_shortcuts,
-            "speed_shortcuts": speed_shortcuts,
-            "pitch_shortcuts": pitch_shortcuts,
-            "noise_reduction_shortcuts": noise_reduction_shortcuts,
-            "compressor_shortcuts": compressor_shortcuts,
-            # Video effect shortcuts
-            "brightness_shortcuts": brightness_shortcuts,
-            "contrast_shortcuts": contrast_shortcuts,
-            "saturation_shortcuts": saturation_shortcuts,
-            "blur_shortcuts": blur_shortcuts,
-            "sharpen_shortcuts": sharpen_shortcuts,
-            "transform_shortcuts": transform_shortcuts,
-            # Current audio preset configs
-            "volume_current": volume_current,
-            "tunnel_current": tunnel_current,
-            "frequency_current": frequency_current,
-            "speed_current": speed_current,
-            "pitch_current": pitch_current,
-            "noise_reduction_current": noise_reduction_current,
-            "compressor_current": compressor_current,
-            # Current video preset configs
-            "brightness_current": brightness_current,
-            "contrast_current": contrast_current,
-            "saturation_current": saturation_current,
-            "blur_current": blur_current,
-            "sharpen_current": sharpen_current,
-            "transform_current": transform_current,
-            # Form defaults based on current settings
-            "delays": "|".join(str(d) for d in tunnel_current.delays),
-            "decays": "|".join(str(d) for d in tunnel_current.decays),
-            # Theme presets for Presets tab
-            "video_theme_presets": video_theme_presets,
-            "audio_theme_presets": audio_theme_presets,
-            "video_theme_chain": user_settings.video_theme_chain,
-            "audio_theme_chain": user_settings.audio_theme_chain,
-        },
-    )
+    # With no input files the page depends only on settings and presets
+    body_cache = None
+    if not input_files and not config.server.reload:
+        body_cache = _get_index_body_cache(
+            (category_presets, video_theme_presets, audio_theme_presets)
+        )
+        body_key = (str(request.base_url), repr(user_settings))
+        body = body_cache.get(body_key)
+        if body is not None:
+            return HTMLResponse(body)
+
+    tunnel_current = current_presets["tunnel"]
+    context = {
+        **_get_index_static_context(category_presets),
+        # Current preset configs (e.g. tunnel_current)
+        **{f"{category}_current": preset_config for category, preset_config in current_presets.items()},
+        "request": request,
+        "input_files": input_files,
+        # Effect chain data
+        "user_settings": user_settings,
+        "current_filename": None,  # No file selected on initial load
+        # Form defaults based on current settings
+        "delays": tunnel_current.delays_str,
+        "decays": tunnel_current.decays_str,
+        # Theme presets for Presets tab
+        "video_theme_presets": video_theme_presets,
+        "audio_theme_presets": audio_theme_presets,
+        "video_theme_chain": user_settings.video_theme_chain,
+        "audio_theme_chain": user_settings.audio_theme_chain,
+    }
+
+    body = templates.get_template("index.html").render(context)
+    if body_cache is not None:
+        body_cache[body_key] = body
+    return HTMLResponse(body)
+
+
+# Constant health payload, encoded once instead of per probe
+_HEALTH_RESPONSE = Response(content=b'{"status":"healthy"}', media_type="application/json")
+
+
+async def health_check(request: Request) -> Response:
+    """Health check endpoint for Docker."""
+    return _HEALTH_RESPONSE
 
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for Docker."""
-    return {"status": "healthy"}
+# Plain Starlette route: probes skip FastAPI's dependency and serialization layers
+app.add_route("/health", health_check, methods=["GET"], include_in_schema=False)
 
 
 def run():
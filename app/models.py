@@ -1,12 +1,18 @@
 """Pydantic models for audio processing."""
 
-from pydantic import BaseModel, Field
-from enum import Enum
+from collections.abc import Mapping
+
+from pydantic import BaseModel, ConfigDict, Field
+from enum import StrEnum
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any
 
 
 # ============ LEGACY PRESET (used by /partials/sliders endpoint) ============
-class PresetLevel(str, Enum):
+class PresetLevel(StrEnum):
     """Tunnel filter intensity presets."""
     NONE = "none"
     LIGHT = "light"
@@ -15,26 +21,38 @@ class PresetLevel(str, Enum):
     EXTREME = "extreme"
 
 
-class PresetConfig(BaseModel):
-    """Configuration for a preset filter level."""
+@dataclass(frozen=True, slots=True)
+class PresetConfig:
+    """Configuration for a preset filter level.
+
+    Static table entries, so a frozen slotted dataclass rather than a
+    validated model. The pipe-joined delays/decays are computed once.
+    """
     name: str
     description: str
     volume: float
     highpass: int
     lowpass: int
-    delays: list[int]
-    decays: list[float]
+    delays: tuple[int, ...]
+    decays: tuple[float, ...]
+    delays_str: str = field(init=False)
+    decays_str: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "delays_str", "|".join(map(str, self.delays)))
+        object.__setattr__(self, "decays_str", "|".join(map(str, self.decays)))
 
 
-PRESETS: dict[PresetLevel, PresetConfig] = {
+# Read-only view: the table is shared by every request
+PRESETS: Mapping[PresetLevel, PresetConfig] = MappingProxyType({
     PresetLevel.NONE: PresetConfig(
         name="No Filter",
         description="Clean audio, no tunnel processing",
         volume=1.0,
         highpass=20,
         lowpass=20000,
-        delays=[1],
-        decays=[0.0],
+        delays=(1,),
+        decays=(0.0,),
     ),
     PresetLevel.LIGHT: PresetConfig(
         name="Light Tunnel",
@@ -42,8 +60,8 @@ PRESETS: dict[PresetLevel, PresetConfig] = {
         volume=2.0,
         highpass=80,
         lowpass=6000,
-        delays=[10, 20],
-        decays=[0.2, 0.15],
+        delays=(10, 20),
+        decays=(0.2, 0.15),
     ),
     PresetLevel.MEDIUM: PresetConfig(
         name="Medium Tunnel",
@@ -51,8 +69,8 @@ PRESETS: dict[PresetLevel, PresetConfig] = {
         volume=2.0,
         highpass=100,
         lowpass=4500,
-        delays=[15, 25, 35, 50],
-        decays=[0.35, 0.3, 0.25, 0.2],
+        delays=(15, 25, 35, 50),
+        decays=(0.35, 0.3, 0.25, 0.2),
     ),
     PresetLevel.HEAVY: PresetConfig(
         name="Heavy Tunnel",
@@ -60,8 +78,8 @@ PRESETS: dict[PresetLevel, PresetConfig] = {
         volume=2.0,
         highpass=120,
         lowpass=3500,
-        delays=[20, 35, 55, 80],
-        decays=[0.4, 0.35, 0.3, 0.25],
+        delays=(20, 35, 55, 80),
+        decays=(0.4, 0.35, 0.3, 0.25),
     ),
     PresetLevel.EXTREME: PresetConfig(
         name="Extreme Tunnel",
@@ -69,16 +87,25 @@ PRESETS: dict[PresetLevel, PresetConfig] = {
         volume=2.0,
         highpass=150,
         lowpass=2500,
-        delays=[25, 45, 70, 100, 140],
-        decays=[0.45, 0.4, 0.35, 0.3, 0.25],
+        delays=(25, 45, 70, 100, 140),
+        decays=(0.45, 0.4, 0.35, 0.3, 0.25),
     ),
-}
+})
 
 
 # ============ AUDIO FILTER CONFIG SCHEMAS ============
 # These are used by presets.py to validate YAML presets
 
-class VolumeConfig(BaseModel):
+class _PresetModel(BaseModel):
+    """Base for filter preset configs.
+
+    Loaded presets are shared by every request and never modified, so they
+    are frozen. Schemas are built on first validation rather than at import.
+    """
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class VolumeConfig(_PresetModel):
     """Configuration for volume preset."""
     name: str
     description: str
@@ -87,7 +114,7 @@ class VolumeConfig(BaseModel):
     is_user_shortcut: bool = False
 
 
-class TunnelConfig(BaseModel):
+class TunnelConfig(_PresetModel):
     """Configuration for tunnel preset."""
     name: str
     description: str
@@ -96,8 +123,18 @@ class TunnelConfig(BaseModel):
     preset_category: str = "General"
     is_user_shortcut: bool = False
 
+    @cached_property
+    def delays_str(self) -> str:
+        """Pipe-separated delays, as used by the form and filter chain."""
+        return "|".join(map(str, self.delays))
+
+    @cached_property
+    def decays_str(self) -> str:
+        """Pipe-separated decays, as used by the form and filter chain."""
+        return "|".join(map(str, self.decays))
 
-class FrequencyConfig(BaseModel):
+
+class FrequencyConfig(_PresetModel):
     """Configuration for frequency preset."""
     name: str
     description: str
@@ -107,7 +144,7 @@ class FrequencyConfig(BaseModel):
     is_user_shortcut: bool = False
 
 
-class SpeedConfig(BaseModel):
+class SpeedConfig(_PresetModel):
     """Configuration for speed preset."""
     name: str
     description: str
@@ -116,7 +153,7 @@ class SpeedConfig(BaseModel):
     is_user_shortcut: bool = False
 
 
-class PitchConfig(BaseModel):
+class PitchConfig(_PresetModel):
     """Configuration for pitch preset."""
     name: str
     description: str
@@ -125,7 +162,7 @@ class PitchConfig(BaseModel):
     is_user_shortcut: bool = False
 
 
-class NoiseReductionConfig(BaseModel):
+class NoiseReductionConfig(_PresetModel):
     """Configuration for noise reduction preset."""
     name: str
     description: str
@@ -135,7 +172,7 @@ class NoiseReductionConfig(BaseModel):
     is_user_shortcut: bool = False
 
 
-class CompressorConfig(BaseModel):
+class CompressorConfig(_PresetModel):
     """Configuration for compressor preset."""
     name: str
     description: str
@@ -150,7 +187,7 @@ class CompressorConfig(BaseModel):
 
 # ============ VIDEO FILTER CONFIG SCHEMAS ============
 
-class BrightnessConfig(BaseModel):
+class BrightnessConfig(_PresetModel):
     """Configuration for brightness preset."""
     name: str
     description: str
@@ -159,7 +196,7 @@ class BrightnessConfig(BaseModel):
     is_user_shortcut: bool = False
 
 
-class ContrastConfig(BaseModel):
+class ContrastConfig(_PresetModel):
     """Configuration for contrast preset."""
     name: str
     description: str
@@ -168,7 +205,7 @@ class ContrastConfig(BaseModel):
     is_user_shortcut: bool = False
 
 
-class SaturationConfig(BaseModel):
+class SaturationConfig(_PresetModel):
     """Configuration for saturation preset."""
     name: str
     description: str
@@ -177,7 +214,7 @@ class SaturationConfig(BaseModel):
     is_user_shortcut: bool = False
 
 
-class BlurConfig(BaseModel):
+class BlurConfig(_PresetModel):
     """Configuration for blur preset."""
     name: str
     description: str
@@ -186,7 +223,7 @@ class BlurConfig(BaseModel):
     is_user_shortcut: bool = False
 
 
-class SharpenConfig(BaseModel):
+class SharpenConfig(_PresetModel):
     """Configuration for sharpen preset."""
     name: str
     description: str
@@ -195,7 +232,7 @@ class SharpenConfig(BaseModel):
     is_user_shortcut: bool = False
 
 
-class TransformConfig(BaseModel):
+class TransformConfig(_PresetModel):
     """Configuration for transform preset."""
     name: str
     description: str
@@ -222,43 +259,68 @@ class ThemePreset(BaseModel):
 
 # ============ USER SETTINGS ============
 
-class CategorySettings(BaseModel):
+@dataclass(slots=True)
+class CategorySettings:
     """Settings for a single filter category."""
     preset: str
-    custom_values: dict = {}
+    custom_values: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CategorySettings":
+        """Build from stored metadata, ignoring keys this version doesn't know."""
+        return cls(
+            preset=data.get("preset", "none"),
+            custom_values=data.get("custom_values") or {},
+        )
+
+
+def _default_category() -> CategorySettings:
+    """Fresh category settings for a category with no preset selected.
 
+    Each UserSettings needs its own instance, since callers mutate them.
+    """
+    return CategorySettings(preset="none")
 
-class UserSettings(BaseModel):
-    """Complete user settings for all categories."""
+
+@dataclass(slots=True)
+class UserSettings:
+    """Complete user settings for all categories.
+
+    Plain dataclasses: settings are built from server-written metadata and
+    mutated in place, so they need no validation.
+    """
     # Audio filters
-    volume: CategorySettings = CategorySettings(preset="none")
-    tunnel: CategorySettings = CategorySettings(preset="none")
-    frequency: CategorySettings = CategorySettings(preset="none")
-    speed: CategorySettings = CategorySettings(preset="none")
-    pitch: CategorySettings = CategorySettings(preset="none")
-    noise_reduction: CategorySettings = CategorySettings(preset="none")
-    compressor: CategorySettings = CategorySettings(preset="none")
+    volume: CategorySettings = field(default_factory=_default_category)
+    tunnel: CategorySettings = field(default_factory=_default_category)
+    frequency: CategorySettings = field(default_factory=_default_category)
+    speed: CategorySettings = field(default_factory=_default_category)
+    pitch: CategorySettings = field(default_factory=_default_category)
+    noise_reduction: CategorySettings = field(default_factory=_default_category)
+    compressor: CategorySettings = field(default_factory=_default_category)
     # Video filters
-    brightness: CategorySettings = CategorySettings(preset="none")
-    contrast: CategorySettings = CategorySettings(preset="none")
-    saturation: CategorySettings = CategorySettings(preset="none")
-    blur: CategorySettings = CategorySettings(preset="none")
-    sharpen: CategorySettings = CategorySettings(preset="none")
-    transform: CategorySettings = CategorySettings(preset="none")
+    brightness: CategorySettings = field(default_factory=_default_category)
+    contrast: CategorySettings = field(default_factory=_default_category)
+    saturation: CategorySettings = field(default_factory=_default_category)
+    blur: CategorySettings = field(default_factory=_default_category)
+    sharpen: CategorySettings = field(default_factory=_default_category)
+    transform: CategorySettings = field(default_factory=_default_category)
     # Theme-only video filters (no UI accordion, used by presets)
-    crop: CategorySettings = CategorySettings(preset="none")
-    colorshift: CategorySettings = CategorySettings(preset="none")
-    overlay: CategorySettings = CategorySettings(preset="none")
-    scale: CategorySettings = CategorySettings(preset="none")
+    crop: CategorySettings = field(default_factory=_default_category)
+    colorshift: CategorySettings = field(default_factory=_default_category)
+    overlay: CategorySettings = field(default_factory=_default_category)
+    scale: CategorySettings = field(default_factory=_default_category)
     active_category: str = ""
     active_tab: str = "audio"
     # Theme preset chains (ordered list, allows combining multiple presets)
-    video_theme_chain: list[str] = []
-    audio_theme_chain: list[str] = []
+    video_theme_chain: list[str] = field(default_factory=list)
+    audio_theme_chain: list[str] = field(default_factory=list)
 
 
 class ProcessRequest(BaseModel):
     """Request model for audio processing."""
+    # Not used by any route, so its validator is only built on first use
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     input_file: str
     start_time: str = "00:00:00"
     end_time: str = "00:00:06"
@@ -270,8 +332,13 @@ class ProcessRequest(BaseModel):
     decays: str = "0"
 
 
-class HistoryEntry(BaseModel):
-    """Model for processing history entry."""
+@dataclass(frozen=True, slots=True)
+class HistoryEntry:
+    """Model for processing history entry.
+
+    Built only from server-written metadata and already-validated form
+    values, so construction skips validation.
+    """
     id: str
     timestamp: datetime
     input_file: str
@@ -2,21 +2,27 @@
 
 from pathlib import Path
 
-import subprocess
-import tempfile
+import asyncio
 import os
+import shutil
+import stat
+import tempfile
+import time
+from collections.abc import Generator
+from typing import BinaryIO
 
 import json
 
 from fastapi import APIRouter, Form, Request, HTTPException, UploadFile, File
 from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, StreamingResponse
-from fastapi.templating import Jinja2Templates
+from starlette.background import BackgroundTask
+from starlette.concurrency import iterate_in_threadpool
 from sse_starlette.sse import EventSourceResponse
 
 from loguru import logger
 
-from app.config import INPUT_DIR, OUTPUT_DIR, config
-from app.models import PresetLevel, PRESETS
+from app.config import INPUT_DIR, OUTPUT_DIR, PREVIEW_DIR, config
+from app.models import PresetConfig, PresetLevel, PRESETS
 from app.services.presets import (
     get_volume_presets,
     get_tunnel_presets,
@@ -32,6 +38,8 @@ from app.services.presets import (
     get_sharpen_presets,
     get_transform_presets,
     get_presets_by_preset_category,
+    get_category_presets,
+    resolve_current_presets,
     reload_presets,
 )
 from app.services.user_shortcuts import (
@@ -60,6 +68,7 @@ from app.services import (
     process_audio_with_filters,
     process_video_with_filters,
     get_input_files,
+    invalidate_input_files_cache,
     get_file_duration,
     format_duration_ms,
     get_file_metadata,
@@ -69,14 +78,55 @@ from app.services import (
 from app.services.processor import process_video_with_progress
 from app.services.file_metadata import load_file_metadata
 from app.services.history import add_history_entry
+from app.services.preview_cache import PreviewCache
+from app.templating import templates
 
-ALLOWED_EXTENSIONS = set(config.audio.allowed_extensions)
+ALLOWED_EXTENSIONS = frozenset(config.audio.allowed_extensions)
+_ALLOWED_EXTENSIONS_STR = ", ".join(sorted(ALLOWED_EXTENSIONS))
+UPLOAD_CHUNK_SIZE = 1 << 20
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
+
+
+def _default_ffmpeg_slots() -> int:
+    """Half the CPUs this process may run on (respecting affinity), at least 1."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        cpus = os.cpu_count() or 2
+    return max(1, cpus // 2)
+
+
+# Bounds concurrent ffmpeg processes, so bursts of requests queue instead of
+# oversubscribing the CPU. Renders (/process, /extract, /transcript and the
+# SSE progress stream) share one pool; short previews get their own pool of
+# the same size so they never wait behind a full render.
+FFMPEG_SLOTS = config.audio.max_concurrent_ffmpeg or _default_ffmpeg_slots()
+_FFMPEG_SEMAPHORE = asyncio.Semaphore(FFMPEG_SLOTS)
+_PREVIEW_SEMAPHORE = asyncio.Semaphore(FFMPEG_SLOTS)
+
+
+async def _run_in_ffmpeg_slot(func, /, *args, **kwargs):
+    """Run a blocking ffmpeg-invoking function in a worker thread.
+
+    Waits for a free slot under the shared ffmpeg concurrency limit.
+    """
+    async with _FFMPEG_SEMAPHORE:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+def _close_generator(gen: Generator) -> None:
+    """Close a sync generator, waiting out a step still running in a thread."""
+    while True:
+        try:
+            gen.close()
+            return
+        except ValueError:  # generator already executing
+            time.sleep(0.05)
 
 
 AUDIO_FORMATS = {"mp3", "wav", "flac"}
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mkv", ".avi", ".mov", ".webm"})
 VIDEO_FORMATS = {"mp4", "webm", "mkv"}
 
 
@@ -97,37 +147,21 @@ async def process(
     # Load user settings from per-file YAML
     user_settings = load_user_settings(input_file)
 
-    # Get preset dictionaries
-    volume_presets = get_volume_presets()
-    tunnel_presets = get_tunnel_presets()
-    frequency_presets = get_frequency_presets()
-    speed_presets = get_speed_presets()
-    pitch_presets = get_pitch_presets()
-    noise_presets = get_noise_reduction_presets()
-    compressor_presets = get_compressor_presets()
-    brightness_presets = get_brightness_presets()
-    contrast_presets = get_contrast_presets()
-    saturation_presets = get_saturation_presets()
-    blur_presets = get_blur_presets()
-    sharpen_presets = get_sharpen_presets()
-    transform_presets = get_transform_presets()
-
-    # Lookup all preset configurations from user settings (with fallbacks)
-    volume_config = volume_presets.get(user_settings.volume.preset) or volume_presets["none"]
-    tunnel_config = tunnel_presets.get(user_settings.tunnel.preset) or tunnel_presets["none"]
-    frequency_config = frequency_presets.get(user_settings.frequency.preset) or frequency_presets["none"]
-    speed_config = speed_presets.get(user_settings.speed.preset) or speed_presets["none"]
-    pitch_config = pitch_presets.get(user_settings.pitch.preset) or pitch_presets["none"]
-    noise_config = noise_presets.get(user_settings.noise_reduction.preset) or noise_presets["none"]
-    comp_config = compressor_presets.get(user_settings.compressor.preset) or compressor_presets["none"]
-
-    # Video filter presets
-    brightness_config = brightness_presets.get(user_settings.brightness.preset) or brightness_presets["none"]
-    contrast_config = contrast_presets.get(user_settings.contrast.preset) or contrast_presets["none"]
-    saturation_config = saturation_presets.get(user_settings.saturation.preset) or saturation_presets["none"]
-    blur_config = blur_presets.get(user_settings.blur.preset) or blur_presets["none"]
-    sharpen_config = sharpen_presets.get(user_settings.sharpen.preset) or sharpen_presets["none"]
-    transform_config = transform_presets.get(user_settings.transform.preset) or transform_presets["none"]
+    # Resolve the selected preset config per category (with fallbacks)
+    current_presets = resolve_current_presets(user_settings)
+    volume_config = current_presets["volume"]
+    tunnel_config = current_presets["tunnel"]
+    frequency_config = current_presets["frequency"]
+    speed_config = current_presets["speed"]
+    pitch_config = current_presets["pitch"]
+    noise_config = current_presets["noise_reduction"]
+    comp_config = current_presets["compressor"]
+    brightness_config = current_presets["brightness"]
+    contrast_config = current_presets["contrast"]
+    saturation_config = current_presets["saturation"]
+    blur_config = current_presets["blur"]
+    sharpen_config = current_presets["sharpen"]
+    transform_config = current_presets["transform"]
 
     # Extract actual filter values - check custom_values first (for theme presets)
     # Audio filters
@@ -137,10 +171,11 @@ async def process(
                     if user_settings.frequency.custom_values else frequency_config.highpass)
     lowpass_val = (user_settings.frequency.custom_values.get("lowpass", frequency_config.lowpass)
                    if user_settings.frequency.custom_values else frequency_config.lowpass)
-    delays_list = (user_settings.tunnel.custom_values.get("delays", tunnel_config.delays)
-                   if user_settings.tunnel.custom_values else tunnel_config.delays)
-    decays_list = (user_settings.tunnel.custom_values.get("decays", tunnel_config.decays)
-                   if user_settings.tunnel.custom_values else tunnel_config.decays)
+    # Preset delays/decays strings are precomputed; only custom lists are joined
+    delays_str = ("|".join(map(str, user_settings.tunnel.custom_values["delays"]))
+                  if "delays" in user_settings.tunnel.custom_values else tunnel_config.delays_str)
+    decays_str = ("|".join(map(str, user_settings.tunnel.custom_values["decays"]))
+                  if "decays" in user_settings.tunnel.custom_values else tunnel_config.decays_str)
     speed_val = (user_settings.speed.custom_values.get("speed", speed_config.speed)
                  if user_settings.speed.custom_values else speed_config.speed)
     pitch_val = (user_settings.pitch.custom_values.get("semitones", pitch_config.semitones)
@@ -187,9 +222,6 @@ async def process(
                         if user_settings.scale.custom_values else 0)
 
     # Build audio filter chain with all filters (speed is linked)
-    delays_str = "|".join(str(d) for d in delays_list)
-    decays_str = "|".join(str(d) for d in decays_list)
-
     audio_filter = build_audio_filter_chain(
         volume=volume_val,
         highpass=highpass_val,
@@ -208,8 +240,7 @@ async def process(
     )
 
     # Check if input is a video file
-    video_extensions = {".mp4", ".mkv", ".avi", ".mov", ".webm"}
-    is_video = input_path.suffix.lower() in video_extensions
+    is_video = input_path.suffix.lower() in VIDEO_EXTENSIONS
 
     # Check if any video filters are active
     video_filters_active = (
@@ -258,7 +289,8 @@ async def process(
                 scale_height=scale_height_val,
             )
 
-            output_path = process_video_with_filters(
+            output_path = await _run_in_ffmpeg_slot(
+                process_video_with_filters,
                 input_file=input_path,
                 start_time=start_time,
                 end_time=end_time,
@@ -268,7 +300,8 @@ async def process(
             )
         else:
             # Audio-only output with full filter chain (all 7 audio filters)
-            output_path = process_audio_with_filters(
+            output_path = await _run_in_ffmpeg_slot(
+                process_audio_with_filters,
                 input_file=input_path,
                 start_time=start_time,
                 end_time=end_time,
@@ -329,7 +362,8 @@ async def extract(
 
     try:
         # Extract audio with neutral settings (no filters)
-        output_path = process_audio(
+        output_path = await _run_in_ffmpeg_slot(
+            process_audio,
             input_file=input_path,
             start_time=start_time,
             end_time=end_time,
@@ -392,7 +426,7 @@ async def extract_transcript(
         raise HTTPException(status_code=404, detail="Input file not found")
 
     try:
-        result = do_extract_transcript(input_file)
+        result = await _run_in_ffmpeg_slot(do_extract_transcript, input_file)
 
         if result.success:
             # Filter cues to clip range if end_time is provided
@@ -447,13 +481,27 @@ async def extract_transcript(
         )
 
 
+def _stat_or_404(file_path: Path) -> os.stat_result:
+    """Stat a requested file, raising 404 unless it is a regular file.
+
+    The result is handed on (e.g. to FileResponse) so the file is only
+    stat()ed once per request.
+    """
+    try:
+        file_stat = file_path.stat()
+    except OSError:  # missing, ENOTDIR, symlink loop, name too long, ...
+        raise HTTPException(status_code=404, detail="File not found") from None
+    # Directories (e.g. /preview/..) and other special files are not served
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise HTTPException(status_code=404, detail="File not found")
+    return file_stat
+
+
 @router.get("/preview/{filename}")
 async def preview_file(filename: str):
     """Serve processed audio, video, or text file."""
     file_path = OUTPUT_DIR / filename
-
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    file_stat = _stat_or_404(file_path)
 
     # Detect media type from extension
     ext = file_path.suffix.lower()
@@ -467,16 +515,14 @@ async def preview_file(filename: str):
     }
     media_type = media_types.get(ext, "application/octet-stream")
 
-    return FileResponse(file_path, media_type=media_type, filename=filename)
+    return FileResponse(file_path, stat_result=file_stat, media_type=media_type, filename=filename)
 
 
 @router.get("/input/{filename}")
 async def input_file(filename: str):
     """Serve input video/audio file with Range request support for seeking."""
     file_path = INPUT_DIR / filename
-
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    file_stat = _stat_or_404(file_path)
 
     # Detect media type from extension
     ext = file_path.suffix.lower()
@@ -490,28 +536,41 @@ async def input_file(filename: str):
     }
     media_type = media_types.get(ext, "application/octet-stream")
 
-    return FileResponse(file_path, media_type=media_type, filename=filename)
+    return FileResponse(file_path, stat_result=file_stat, media_type=media_type, filename=filename)
+
+
+# Rendered slider forms per legacy preset. The form depends only on the
+# (immutable) preset, so it is rendered once outside dev mode.
+_slider_form_cache: dict[PresetConfig, str] = {}
 
 
 @router.get("/partials/sliders", response_class=HTMLResponse)
 async def get_sliders(request: Request, preset: str = config.audio.default_preset):
     """Get slider form populated with preset values."""
-    try:
-        preset_level = PresetLevel(preset)
-        preset_config = PRESETS[preset_level]
-    except ValueError:
-        preset_level = PresetLevel.NONE
-        preset_config = PRESETS[preset_level]
+    # PresetLevel is a StrEnum, so the raw query string indexes PRESETS directly
+    preset_config = PRESETS.get(preset) or PRESETS[PresetLevel.NONE]
 
-    return templates.TemplateResponse(
-        "partials/slider_form.html",
-        {
+    body = _slider_form_cache.get(preset_config)
+    if body is None:
+        body = templates.get_template("partials/slider_form.html").render({
             "request": request,
             "preset": preset_config,
-            "delays": "|".join(str(d) for d in preset_config.delays),
-            "decays": "|".join(str(d) for d in preset_config.decays),
-        },
-    )
+            "delays": preset_config.delays_str,
+            "decays": preset_config.decays_str,
+        })
+        if not config.server.reload:
+            _slider_form_cache[preset_config] = body
+    return HTMLResponse(body)
+
+
+def _write_upload(src: BinaryIO, fd: int) -> int:
+    """Copy an upload into the open file fd in chunks; return the bytes written.
+
+    Chunked so large media never sits in memory whole.
+    """
+    with open(fd, "wb") as out:
+        shutil.copyfileobj(src, out, UPLOAD_CHUNK_SIZE)
+        return out.tell()
 
 
 @router.post("/upload", response_class=HTMLResponse)
@@ -529,18 +588,28 @@ async def upload_file(request: Request, file: UploadFile = File(...)):
             "partials/upload_status.html",
             {
                 "request": request,
-                "error": f"Invalid file type: {ext}. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}",
+                "error": f"Invalid file type: {ext}. Allowed: {_ALLOWED_EXTENSIONS_STR}",
                 "success": False,
             },
         )
 
     safe_filename = Path(file.filename).name
     dest_path = INPUT_DIR / safe_filename
+    # Written under a unique .part name (ignored by get_input_files) and
+    # renamed into place, so a partial upload is never listed as an input
+    # file and concurrent uploads of the same name can't interleave
+    fd, part_name = tempfile.mkstemp(
+        dir=INPUT_DIR, prefix=f".{safe_filename}.", suffix=".part"
+    )
+    part_path = Path(part_name)
+    os.fchmod(fd, 0o644)  # mkstemp creates 0600; match a normally written file
 
     try:
-        content = await file.read()
-        dest_path.write_bytes(content)
-        logger.info(f"Uploaded file: {safe_filename} ({len(content)} bytes)")
+        # Copied on a worker thread so the disk writes don't block the loop
+        size = await asyncio.to_thread(_write_upload, file.file, fd)
+        os.replace(part_path, dest_path)
+        invalidate_input_files_cache(INPUT_DIR)
+        logger.info(f"Uploaded file: {safe_filename} ({size} bytes)")
 
         input_files = get_input_files(INPUT_DIR)
         return templates.TemplateResponse(
@@ -554,6 +623,7 @@ async def upload_file(request: Request, file: UploadFile = File(...)):
         )
     except Exception as e:
         logger.exception("Upload failed")
+        part_path.unlink(missing_ok=True)
         return templates.TemplateResponse(
             "partials/upload_status.html",
             {"request": request, "error": str(e), "success": False},
@@ -564,15 +634,14 @@ async def upload_file(request: Request, file: UploadFile = File(...)):
 async def get_duration(filename: str):
     """Get file metadata including duration, title, and tags."""
     file_path = INPUT_DIR / filename
+    file_stat = _stat_or_404(file_path)
 
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
-
-    metadata = get_file_metadata(file_path)
+    # ffprobe runs in a worker thread so other requests keep being served
+    metadata = await asyncio.to_thread(get_file_metadata, file_path, file_stat)
 
     if "duration_ms" not in metadata:
         # Fallback to basic duration detection
-        duration_ms = get_file_duration(file_path)
+        duration_ms = await asyncio.to_thread(get_file_duration, file_path, file_stat)
         if duration_ms is None:
             raise HTTPException(status_code=500, detail="Could not determine duration")
         metadata["duration_ms"] = duration_ms
@@ -590,61 +659,103 @@ async def get_duration(filename: str):
     return JSONResponse(metadata)
 
 
+async def _run_ffmpeg(cmd: list[str], timeout: float) -> tuple[int, bytes]:
+    """Run a preview ffmpeg command without blocking the event loop.
+
+    Returns (returncode, stderr). Waits up to timeout seconds for a free
+    preview slot, raising HTTPException(503) if none frees up. Raises
+    TimeoutError after killing the process if it runs longer than timeout.
+    """
+    try:
+        await asyncio.wait_for(_PREVIEW_SEMAPHORE.acquire(), timeout)
+    except TimeoutError:
+        raise HTTPException(status_code=503, detail="Server busy, try again shortly") from None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+    finally:
+        _PREVIEW_SEMAPHORE.release()
+    return proc.returncode, stderr
+
+
+def _safe_unlink(path: str | Path) -> None:
+    """Remove a temp file, ignoring it if it is already gone."""
+    Path(path).unlink(missing_ok=True)
+
+
+# Generated audio previews, keyed by (filename, input mtime_ns, start, end).
+# Files live in PREVIEW_DIR, which is emptied at startup and shutdown.
+_PREVIEW_CACHE_SIZE = 32
+_PREVIEW_CACHE_BYTES = 256 << 20
+preview_cache = PreviewCache(PREVIEW_DIR, _PREVIEW_CACHE_SIZE, _PREVIEW_CACHE_BYTES)
+
+
+async def _generate_audio_preview(
+    input_path: Path, start: str, end: str, output_path: Path
+) -> None:
+    """Encode the start-end range of input_path to an mp3 at output_path."""
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-ss", start,
+        "-to", end,
+        "-i", str(input_path),
+        "-vn",
+        "-acodec", "libmp3lame",
+        "-q:a", config.audio.mp3_quality,
+        str(output_path),
+    ]
+
+    try:
+        returncode, stderr = await _run_ffmpeg(cmd, config.audio.preview_timeout)
+    except TimeoutError:
+        raise HTTPException(status_code=408, detail="Preview generation timed out") from None
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Preview generation error")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    if returncode != 0:
+        logger.warning(f"Preview generation failed: {stderr}")
+        raise HTTPException(status_code=500, detail="Preview generation failed")
+
+
 @router.get("/clip-preview")
 async def clip_preview(filename: str, start: str, end: str):
     """
     Generate a preview clip on-the-fly for the range slider.
     Uses streamcopy for speed when possible.
+
+    Repeat requests for the same range of an unchanged file reuse the
+    previously generated clip, and concurrent ones share one ffmpeg run.
     """
     input_path = INPUT_DIR / filename
 
-    if not input_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
-
-    # Create temporary file for preview
-    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-        tmp_path = tmp.name
+    input_mtime = _stat_or_404(input_path).st_mtime_ns
 
-    try:
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-ss", start,
-            "-to", end,
-            "-i", str(input_path),
-            "-vn",
-            "-acodec", "libmp3lame",
-            "-q:a", config.audio.mp3_quality,
-            tmp_path,
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, timeout=config.audio.preview_timeout)
-
-        if result.returncode != 0:
-            logger.warning(f"Preview generation failed: {result.stderr}")
-            raise HTTPException(status_code=500, detail="Preview generation failed")
-
-        def iterfile():
-            with open(tmp_path, "rb") as f:
-                yield from f
-            os.unlink(tmp_path)
-
-        return StreamingResponse(
-            iterfile(),
-            media_type="audio/mpeg",
-            headers={"Content-Disposition": "inline; filename=preview.mp3"}
-        )
-    except subprocess.TimeoutExpired:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-        raise HTTPException(status_code=408, detail="Preview generation timed out")
-    except HTTPException:
-        raise
-    except Exception as e:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-        logger.exception("Preview generation error")
-        raise HTTPException(status_code=500, detail=str(e))
+    entry = await preview_cache.acquire(
+        (filename, input_mtime, start, end),
+        ".mp3",
+        lambda output_path: _generate_audio_preview(input_path, start, end, output_path),
+    )
+    # Held until the response has been sent, so eviction can't remove the
+    # file before (or while) it is streamed
+    return FileResponse(
+        entry.path,
+        media_type="audio/mpeg",
+        headers={"Content-Disposition": "inline; filename=preview.mp3"},
+        background=BackgroundTask(preview_cache.release, entry),
+    )
 
 
 @router.get("/clip-video-preview")
@@ -658,127 +769,69 @@ async def clip_video_preview(filename: str, start: str, end: str):
         raise HTTPException(status_code=404, detail="File not found")
 
     # Check if it's a video file
-    video_extensions = {".mp4", ".mkv", ".avi", ".mov", ".webm"}
     ext = input_path.suffix.lower()
-    if ext not in video_extensions:
+    if ext not in VIDEO_EXTENSIONS:
         raise HTTPException(status_code=400, detail="Not a video file")
 
-    # Create temporary file for preview
-    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
-        tmp_path = tmp.name
+    # Created in the preview directory so shutdown cleans up after it
+    tmp_path = str(preview_cache.new_path(".mp4"))
+
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-ss", start,
+        "-to", end,
+        "-i", str(input_path),
+        "-c:v", "libx264",
+        "-preset", "ultrafast",
+        "-crf", "28",
+        "-c:a", "aac",
+        "-b:a", "128k",
+        "-movflags", "+faststart",
+        tmp_path,
+    ]
 
     try:
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-ss", start,
-            "-to", end,
-            "-i", str(input_path),
-            "-c:v", "libx264",
-            "-preset", "ultrafast",
-            "-crf", "28",
-            "-c:a", "aac",
-            "-b:a", "128k",
-            "-movflags", "+faststart",
-            tmp_path,
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, timeout=config.audio.preview_timeout)
-
-        if result.returncode != 0:
-            logger.warning(f"Video preview generation failed: {result.stderr}")
-            raise HTTPException(status_code=500, detail="Video preview generation failed")
-
-        def iterfile():
-            with open(tmp_path, "rb") as f:
-                yield from f
-            os.unlink(tmp_path)
-
-        return StreamingResponse(
-            iterfile(),
-            media_type="video/mp4",
-            headers={"Content-Disposition": "inline; filename=preview.mp4"}
-        )
-    except subprocess.TimeoutExpired:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        returncode, stderr = await _run_ffmpeg(cmd, config.audio.preview_timeout)
+    except TimeoutError:
+        _safe_unlink(tmp_path)
         raise HTTPException(status_code=408, detail="Video preview generation timed out")
     except HTTPException:
+        _safe_unlink(tmp_path)
         raise
     except Exception as e:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        _safe_unlink(tmp_path)
         logger.exception("Video preview generation error")
         raise HTTPException(status_code=500, detail=str(e))
 
+    if returncode != 0:
+        _safe_unlink(tmp_path)
+        logger.warning(f"Video preview generation failed: {stderr}")
+        raise HTTPException(status_code=500, detail="Video preview generation failed")
+
+    # Sent with sendfile; the temp file is removed once the response completes
+    return FileResponse(
+        tmp_path,
+        media_type="video/mp4",
+        headers={"Content-Disposition": "inline; filename=preview.mp4"},
+        background=BackgroundTask(_safe_unlink, tmp_path),
+    )
+
 
 # ============ EFFECT CHAIN ENDPOINTS ============
 
 def _get_accordion_context(user_settings, filename: str | None = None) -> dict:
     """Build context dict for accordion template."""
-    # Get shortcut dictionaries from YAML
-    volume_shortcuts = get_volume_presets()
-    tunnel_shortcuts = get_tunnel_presets()
-    frequency_shortcuts = get_frequency_presets()
-    speed_shortcuts = get_speed_presets()
-    pitch_shortcuts = get_pitch_presets()
-    noise_reduction_shortcuts = get_noise_reduction_presets()
-    compressor_shortcuts = get_compressor_presets()
-    brightness_shortcuts = get_brightness_presets()
-    contrast_shortcuts = get_contrast_presets()
-    saturation_shortcuts = get_saturation_presets()
-    blur_shortcuts = get_blur_presets()
-    sharpen_shortcuts = get_sharpen_presets()
-    transform_shortcuts = get_transform_presets()
-
-    # Get current shortcut configs for each category (with fallbacks)
-    volume_current = volume_shortcuts.get(user_settings.volume.preset) or volume_shortcuts["none"]
-    tunnel_current = tunnel_shortcuts.get(user_settings.tunnel.preset) or tunnel_shortcuts["none"]
-    frequency_current = frequency_shortcuts.get(user_settings.frequency.preset) or frequency_shortcuts["none"]
-    speed_current = speed_shortcuts.get(user_settings.speed.preset) or speed_shortcuts["none"]
-    pitch_current = pitch_shortcuts.get(user_settings.pitch.preset) or pitch_shortcuts["none"]
-    noise_reduction_current = noise_reduction_shortcuts.get(user_settings.noise_reduction.preset) or noise_reduction_shortcuts["none"]
-    compressor_current = compressor_shortcuts.get(user_settings.compressor.preset) or compressor_shortcuts["none"]
-
-    # Video filters
-    brightness_current = brightness_shortcuts.get(user_settings.brightness.preset) or brightness_shortcuts["none"]
-    contrast_current = contrast_shortcuts.get(user_settings.contrast.preset) or contrast_shortcuts["none"]
-    saturation_current = saturation_shortcuts.get(user_settings.saturation.preset) or saturation_shortcuts["none"]
-    blur_current = blur_shortcuts.get(user_settings.blur.preset) or blur_shortcuts["none"]
-    sharpen_current = sharpen_shortcuts.get(user_settings.sharpen.preset) or sharpen_shortcuts["none"]
-    transform_current = transform_shortcuts.get(user_settings.transform.preset) or transform_shortcuts["none"]
+    # Shortcut dictionaries from YAML and the current config per category
+    category_presets = get_category_presets()
+    current_presets = resolve_current_presets(user_settings, category_presets)
 
     return {
         "user_settings": user_settings,
-        # Audio shortcuts
-        "volume_shortcuts": volume_shortcuts,
-        "tunnel_shortcuts": tunnel_shortcuts,
-        "frequency_shortcuts": frequency_shortcuts,
-        "speed_shortcuts": speed_shortcuts,
-        "pitch_shortcuts": pitch_shortcuts,
-        "noise_reduction_shortcuts": noise_reduction_shortcuts,
-        "compressor_shortcuts": compressor_shortcuts,
-        # Video shortcuts
-        "brightness_shortcuts": brightness_shortcuts,
-        "contrast_shortcuts": contrast_shortcuts,
-        "saturation_shortcuts": saturation_shortcuts,
-        "blur_shortcuts": blur_shortcuts,
-        "sharpen_shortcuts": sharpen_shortcuts,
-        "transform_shortcuts": transform_shortcuts,
-        # Current values
-        "volume_current": volume_current,
-        "tunnel_current": tunnel_current,
-        "frequency_current": frequency_current,
-        "speed_current": speed_current,
-        "pitch_current": pitch_current,
-        "noise_reduction_current": noise_reduction_current,
-        "compressor_current": compressor_current,
-        "brightness_current": brightness_current,
-        "contrast_current": contrast_current,
-        "saturation_current": saturation_current,
-        "blur_current": blur_current,
-        "sharpen_current": sharpen_current,
-        "transform_current": transform_current,
+        # e.g. volume_shortcuts
+        **{f"{category}_shortcuts": presets for category, presets in category_presets.items()},
+        # e.g. volume_current
+        **{f"{category}_current": preset_config for category, preset_config in current_presets.items()},
         "current_filename": filename,
     }
 
@@ -821,11 +874,17 @@ AUDIO_CATEGORIES = ("volume", "tunnel", "frequency", "speed", "pitch", "noise_re
 VIDEO_CATEGORIES = ("brightness", "contrast", "saturation", "blur", "sharpen", "transform", "crop", "colorshift", "overlay", "scale")
 ALL_CATEGORIES = AUDIO_CATEGORIES + VIDEO_CATEGORIES
 
+# Accordion partial per category; also the hashed membership check for categories
+ACCORDION_TEMPLATES = {
+    **{category: "partials/filters_audio_accordion.html" for category in AUDIO_CATEGORIES},
+    **{category: "partials/filters_video_accordion.html" for category in VIDEO_CATEGORIES},
+}
+
 
 @router.get("/partials/category-panel/{category}", response_class=HTMLResponse)
 async def get_category_panel(request: Request, category: str, filename: str | None = None):
     """Get the control panel for a specific category (legacy endpoint - returns accordion)."""
-    if category not in ALL_CATEGORIES:
+    if category not in ACCORDION_TEMPLATES:
         raise HTTPException(status_code=404, detail="Category not found")
 
     user_settings = update_active_category(category, filename)
@@ -851,33 +910,27 @@ async def get_accordion_section(
     current_category: str | None = None,
 ):
     """Expand an accordion section (collapses others)."""
-    if category not in ALL_CATEGORIES:
+    template_name = ACCORDION_TEMPLATES.get(category)
+    if template_name is None:
         raise HTTPException(status_code=404, detail="Category not found")
 
     user_settings = update_active_category(category, filename, current_category)
     context = _get_accordion_context(user_settings, filename)
     context["request"] = request
-
-    # Return correct template based on category type
-    if category in VIDEO_CATEGORIES:
-        return templates.TemplateResponse("partials/filters_video_accordion.html", context)
-    return templates.TemplateResponse("partials/filters_audio_accordion.html", context)
+    return templates.TemplateResponse(template_name, context)
 
 
 @router.post("/partials/accordion-preset/{category}/{preset}", response_class=HTMLResponse)
 async def set_accordion_preset(request: Request, category: str, preset: str, filename: str = Form("")):
     """Update a category's preset and return updated accordion."""
-    if category not in ALL_CATEGORIES:
+    template_name = ACCORDION_TEMPLATES.get(category)
+    if template_name is None:
         raise HTTPException(status_code=404, detail="Category not found")
 
     user_settings = update_category_preset(category, preset, filename)
     context = _get_accordion_context(user_settings, filename)
     context["request"] = request
-
-    # Return correct template based on category type
-    if category in VIDEO_CATEGORIES:
-        return templates.TemplateResponse("partials/filters_video_accordion.html", context)
-    return templates.TemplateResponse("partials/filters_audio_accordion.html", context)
+    return templates.TemplateResponse(template_name, context)
 
 
 # ============ PRESET MANAGEMENT ENDPOINTS ============
@@ -1274,42 +1327,28 @@ async def process_with_progress(
     # Load user settings
     user_settings = load_user_settings(input_file)
 
-    # Get preset dictionaries (abbreviated - only what's needed)
-    volume_presets = get_volume_presets()
-    tunnel_presets = get_tunnel_presets()
-    frequency_presets = get_frequency_presets()
-    speed_presets = get_speed_presets()
-    pitch_presets = get_pitch_presets()
-    noise_presets = get_noise_reduction_presets()
-    compressor_presets = get_compressor_presets()
-    brightness_presets = get_brightness_presets()
-    contrast_presets = get_contrast_presets()
-    saturation_presets = get_saturation_presets()
-    blur_presets = get_blur_presets()
-    sharpen_presets = get_sharpen_presets()
-    transform_presets = get_transform_presets()
-
-    # Get configs
-    volume_config = volume_presets.get(user_settings.volume.preset) or volume_presets["none"]
-    tunnel_config = tunnel_presets.get(user_settings.tunnel.preset) or tunnel_presets["none"]
-    frequency_config = frequency_presets.get(user_settings.frequency.preset) or frequency_presets["none"]
-    speed_config = speed_presets.get(user_settings.speed.preset) or speed_presets["none"]
-    pitch_config = pitch_presets.get(user_settings.pitch.preset) or pitch_presets["none"]
-    noise_config = noise_presets.get(user_settings.noise_reduction.preset) or noise_presets["none"]
-    comp_config = compressor_presets.get(user_settings.compressor.preset) or compressor_presets["none"]
-    brightness_config = brightness_presets.get(user_settings.brightness.preset) or brightness_presets["none"]
-    contrast_config = contrast_presets.get(user_settings.contrast.preset) or contrast_presets["none"]
-    saturation_config = saturation_presets.get(user_settings.saturation.preset) or saturation_presets["none"]
-    blur_config = blur_presets.get(user_settings.blur.preset) or blur_presets["none"]
-    sharpen_config = sharpen_presets.get(user_settings.sharpen.preset) or sharpen_presets["none"]
-    transform_config = transform_presets.get(user_settings.transform.preset) or transform_presets["none"]
+    # Resolve the selected preset config per category (with fallbacks)
+    current_presets = resolve_current_presets(user_settings)
+    volume_config = current_presets["volume"]
+    tunnel_config = current_presets["tunnel"]
+    frequency_config = current_presets["frequency"]
+    speed_config = current_presets["speed"]
+    pitch_config = current_presets["pitch"]
+    noise_config = current_presets["noise_reduction"]
+    comp_config = current_presets["compressor"]
+    brightness_config = current_presets["brightness"]
+    contrast_config = current_presets["contrast"]
+    saturation_config = current_presets["saturation"]
+    blur_config = current_presets["blur"]
+    sharpen_config = current_presets["sharpen"]
+    transform_config = current_presets["transform"]
 
     # Extract values (simplified - uses custom_values if present)
     volume_val = user_settings.volume.custom_values.get("volume", volume_config.volume) if user_settings.volume.custom_values else volume_config.volume
     highpass_val = user_settings.frequency.custom_values.get("highpass", frequency_config.highpass) if user_settings.frequency.custom_values else frequency_config.highpass
     lowpass_val = user_settings.frequency.custom_values.get("lowpass", frequency_config.lowpass) if user_settings.frequency.custom_values else frequency_config.lowpass
-    delays_list = user_settings.tunnel.custom_values.get("delays", tunnel_config.delays) if user_settings.tunnel.custom_values else tunnel_config.delays
-    decays_list = user_settings.tunnel.custom_values.get("decays", tunnel_config.decays) if user_settings.tunnel.custom_values else tunnel_config.decays
+    delays_str = "|".join(map(str, user_settings.tunnel.custom_values["delays"])) if "delays" in user_settings.tunnel.custom_values else tunnel_config.delays_str
+    decays_str = "|".join(map(str, user_settings.tunnel.custom_values["decays"])) if "decays" in user_settings.tunnel.custom_values else tunnel_config.decays_str
     speed_val = user_settings.speed.custom_values.get("speed", speed_config.speed) if user_settings.speed.custom_values else speed_config.speed
     pitch_val = user_settings.pitch.custom_values.get("semitones", pitch_config.semitones) if user_settings.pitch.custom_values else pitch_config.semitones
     noise_floor_val = user_settings.noise_reduction.custom_values.get("noise_floor", noise_config.noise_floor) if user_settings.noise_reduction.custom_values else noise_config.noise_floor
@@ -1336,9 +1375,6 @@ async def process_with_progress(
     scale_height_val = user_settings.scale.custom_values.get("height", 0) if user_settings.scale.custom_values else 0
 
     # Build filter chains
-    delays_str = "|".join(str(d) for d in delays_list)
-    decays_str = "|".join(str(d) for d in decays_list)
-
     audio_filter = build_audio_filter_chain(
         volume=volume_val,
         highpass=highpass_val,
@@ -1380,21 +1416,32 @@ async def process_with_progress(
         """Generate SSE events from processor."""
         output_file = None
         try:
-            for update in process_video_with_progress(
-                input_file=input_path,
-                start_time=start_time,
-                end_time=end_time,
-                audio_filter=audio_filter,
-                video_filter=video_filter,
-                output_format=output_format,
-                total_duration_ms=total_duration_ms,
-            ):
-                yield {
-                    "event": update["type"],
-                    "data": json.dumps(update),
-                }
-                if update["type"] == "complete":
-                    output_file = update.get("output_file")
+            # Each step of the blocking ffmpeg reader runs in the threadpool,
+            # holding a render slot until ffmpeg exits (previews use their
+            # own pool, so they don't queue behind this)
+            async with _FFMPEG_SEMAPHORE:
+                progress = process_video_with_progress(
+                    input_file=input_path,
+                    start_time=start_time,
+                    end_time=end_time,
+                    audio_filter=audio_filter,
+                    video_filter=video_filter,
+                    output_format=output_format,
+                    total_duration_ms=total_duration_ms,
+                )
+                try:
+                    async for update in iterate_in_threadpool(progress):
+                        yield {
+                            "event": update["type"],
+                            "data": json.dumps(update),
+                        }
+                        if update["type"] == "complete":
+                            output_file = update.get("output_file")
+                finally:
+                    # On client disconnect the generator is left suspended with
+                    # ffmpeg running; closing it kills ffmpeg before the slot
+                    # is released
+                    await asyncio.to_thread(_close_generator, progress)
 
             # Add history entry on success
             if output_file:
@@ -2,16 +2,15 @@
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from loguru import logger
 
 from app.config import INPUT_DIR
 from app.services.downloader import download_video, validate_url, get_video_info
 from app.services import get_input_files
+from app.templating import templates
 
 router = APIRouter(prefix="/download")
-templates = Jinja2Templates(directory="app/templates")
 
 
 @router.post("/validate", response_class=HTMLResponse)
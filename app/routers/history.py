@@ -4,7 +4,6 @@ import json
 
 from fastapi import APIRouter, Request, HTTPException
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from loguru import logger
 
@@ -13,9 +12,9 @@ from app.services.settings import load_user_settings, update_category_preset
 from app.services.presets_themes import get_video_theme_presets, get_audio_theme_presets
 from app.models import UserSettings, CategorySettings
 from app.routers.audio import _get_accordion_context
+from app.templating import templates
 
 router = APIRouter(prefix="/history")
-templates = Jinja2Templates(directory="app/templates")
 
 
 @router.get("", response_class=HTMLResponse)
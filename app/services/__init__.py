@@ -8,6 +8,7 @@ from app.services.metadata import (
     get_file_duration,
     get_input_files,
     get_file_metadata,
+    invalidate_input_files_cache,
 )
 
 # Audio filter builders
@@ -60,6 +61,7 @@ __all__ = [
     "get_file_duration",
     "get_input_files",
     "get_file_metadata",
+    "invalidate_input_files_cache",
     # Audio filters
     "build_speed_filter",
     "build_pitch_filter",
@@ -5,11 +5,11 @@ import hashlib
 from pathlib import Path
 from dataclasses import dataclass
 
-import yt_dlp
 from loguru import logger
 
 from app.config import INPUT_DIR, config
 from app.services.file_metadata import create_file_metadata
+from app.services.metadata import invalidate_input_files_cache
 
 
 @dataclass
@@ -63,6 +63,8 @@ def validate_url(url: str) -> tuple[bool, str]:
     if not url_pattern.match(url):
         return False, "Invalid URL format"
 
+    import yt_dlp  # Deferred: heavy import only needed once a download starts
+
     try:
         with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
             ydl.extract_info(url, download=False)
@@ -75,6 +77,8 @@ def validate_url(url: str) -> tuple[bool, str]:
 
 def get_video_info(url: str) -> dict | None:
     """Get video metadata without downloading."""
+    import yt_dlp
+
     try:
         ydl_opts = {
             'quiet': True,
@@ -121,9 +125,12 @@ def download_video(url: str) -> DownloadResult:
         "merge_output_format": "mp4",
     }
 
+    import yt_dlp
+
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             ydl.download([url])
+        invalidate_input_files_cache(INPUT_DIR)
 
         # Find downloaded file (exclude .yml metadata files)
         downloaded_files = [
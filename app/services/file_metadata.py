@@ -4,6 +4,7 @@ Each input file gets a companion .yml with source metadata,
 processing history, and effect chain settings.
 """
 
+import copy
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -12,6 +13,10 @@ import yaml
 from loguru import logger
 
 from app.config import INPUT_DIR
+from app.yaml_compat import SafeDumper, SafeLoader
+
+# Parsed metadata per .yml path, keyed by the file's (mtime_ns, size)
+_metadata_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
 
 
 def get_metadata_path(filename: str) -> Path:
@@ -23,16 +28,33 @@ def get_metadata_path(filename: str) -> Path:
 def load_file_metadata(filename: str) -> dict[str, Any]:
     """Load metadata for a specific input file.
 
-    Returns default structure if file doesn't exist.
+    Returns default structure if file doesn't exist. Parsed files are
+    cached until their mtime or size changes; callers get a deep copy
+    they are free to mutate.
+    """
+    return copy.deepcopy(_load_cached_metadata(filename))
+
+
+def _load_cached_metadata(filename: str) -> dict[str, Any]:
+    """Load metadata for a file, returning the shared cached dict.
+
+    Callers must not mutate the result; load_file_metadata() returns a copy.
     """
     meta_path = get_metadata_path(filename)
 
-    if not meta_path.exists():
+    try:
+        stat = meta_path.stat()
+    except FileNotFoundError:
         return get_default_metadata()
 
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _metadata_cache.get(meta_path)
+    if cached and cached[0] == cache_key:
+        return cached[1]
+
     try:
         with open(meta_path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=SafeLoader) or {}
 
         # Ensure required sections exist
         if "source" not in data:
@@ -42,6 +64,7 @@ def load_file_metadata(filename: str) -> dict[str, Any]:
         if "history" not in data:
             data["history"] = []
 
+        _metadata_cache[meta_path] = (cache_key, data)
         return data
     except Exception as e:
         logger.warning(f"Failed to load metadata for {filename}: {e}")
@@ -54,7 +77,9 @@ def save_file_metadata(filename: str, metadata: dict[str, Any]) -> bool:
 
     try:
         with open(meta_path, "w") as f:
-            yaml.safe_dump(metadata, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(metadata, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+        # Drop the cached parse so a write within the same mtime tick is not missed
+        _metadata_cache.pop(meta_path, None)
 
         logger.debug(f"Saved metadata to {meta_path}")
         return True
@@ -141,9 +166,12 @@ def get_display_title(filename: str) -> str:
 
 
 def get_file_settings(filename: str) -> dict[str, Any]:
-    """Get effect chain settings for a file."""
-    metadata = load_file_metadata(filename)
-    return metadata.get("settings", get_default_settings())
+    """Get effect chain settings for a file.
+
+    Only the settings section is copied, not the file's whole history.
+    """
+    settings = _load_cached_metadata(filename).get("settings")
+    return copy.deepcopy(settings) if settings is not None else get_default_settings()
 
 
 def update_file_settings(filename: str, category: str, preset: str) -> dict[str, Any]:
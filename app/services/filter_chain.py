@@ -1,5 +1,7 @@
 """Filter chain builders that aggregate individual filters."""
 
+from functools import lru_cache
+
 from app.services.filters_audio import (
     build_speed_filter,
     build_pitch_filter,
@@ -18,6 +20,15 @@ from app.services.filters_video import (
 )
 
 
+@lru_cache(maxsize=128)
+def _parse_decays(decays: str) -> tuple[float, ...]:
+    """Parse a pipe-separated decays string (e.g. "0.35|0.3") into floats.
+
+    Cached because the same handful of preset strings is submitted repeatedly.
+    """
+    return tuple(float(d) for d in decays.split("|") if d.strip())
+
+
 def build_audio_filter_chain(
     volume: float = 1.0,
     highpass: int = 20,
@@ -52,10 +63,8 @@ def build_audio_filter_chain(
         filters.append(f"lowpass=f={lowpass}")
 
     # Tunnel/echo
-    if delays and decays:
-        decay_values = [float(d) for d in decays.split("|") if d.strip()]
-        if any(d > 0 for d in decay_values):
-            filters.append(f"aecho=0.8:0.85:{delays}:{decays}")
+    if delays and decays and any(d > 0 for d in _parse_decays(decays)):
+        filters.append(f"aecho=0.8:0.85:{delays}:{decays}")
 
     # Speed
     speed_filter = build_speed_filter(speed)
@@ -39,6 +39,34 @@ def build_transform_filter(filter_str: str) -> str:
     return filter_str if filter_str else ""
 
 
+# Crop expressions per aspect ratio. min() keeps the crop inside the input
+# for both landscape (height-based) and portrait (width-based) videos.
+_CROP_FILTERS = {
+    "4:3": "crop=min(iw\\,ih*4/3):min(ih\\,iw*3/4)",
+    "16:9": "crop=min(iw\\,ih*16/9):min(ih\\,iw*9/16)",
+    "1:1": "crop=min(iw\\,ih):min(iw\\,ih)",
+}
+
+_OVERLAY_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf"
+
+# drawtext chains per overlay type. FFmpeg drawtext escaping:
+# - Filter parser runs BEFORE text expansion
+# - ALL colons in text value must be escaped as \: at filter level
+# - After filter parsing, \: becomes : for text expansion
+_OVERLAY_FILTERS = {
+    # Timestamp top-left, REC indicator top-right, CAM ID bottom-left
+    "security_cam": (
+        f"drawtext=fontfile={_OVERLAY_FONT}:"
+        "text='%{localtime\\:%Y-%m-%d %H\\:%M\\:%S}':"
+        "fontcolor=white:fontsize=18:x=10:y=10,"
+        f"drawtext=fontfile={_OVERLAY_FONT}:"
+        "text='REC':fontcolor=red:fontsize=18:x=w-tw-10:y=10,"
+        f"drawtext=fontfile={_OVERLAY_FONT}:"
+        "text='CAM 01':fontcolor=white:fontsize=16:x=10:y=h-th-10"
+    ),
+}
+
+
 def build_crop_filter(aspect_ratio: str) -> str:
     """
     Build crop filter for aspect ratio change.
@@ -49,16 +77,7 @@ def build_crop_filter(aspect_ratio: str) -> str:
     if not aspect_ratio or aspect_ratio == "original":
         return ""
 
-    # Map aspect ratio to crop expression
-    # Use min() to ensure crop doesn't exceed input dimensions
-    # For landscape: uses height-based calculation
-    # For portrait: uses width-based calculation
-    ratios = {
-        "4:3": "crop=min(iw\\,ih*4/3):min(ih\\,iw*3/4)",
-        "16:9": "crop=min(iw\\,ih*16/9):min(ih\\,iw*9/16)",
-        "1:1": "crop=min(iw\\,ih):min(iw\\,ih)",
-    }
-    return ratios.get(aspect_ratio, "")
+    return _CROP_FILTERS.get(aspect_ratio, "")
 
 
 def build_overlay_filter(overlay_type: str) -> str:
@@ -69,23 +88,7 @@ def build_overlay_filter(overlay_type: str) -> str:
 
     Note: Colons in drawtext text values must be escaped as \\: for FFmpeg.
     """
-    if overlay_type == "security_cam":
-        # Timestamp top-left, REC indicator top-right, CAM ID bottom-left
-        font = "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf"
-        # FFmpeg drawtext escaping:
-        # - Filter parser runs BEFORE text expansion
-        # - ALL colons in text value must be escaped as \: at filter level
-        # - After filter parsing, \: becomes : for text expansion
-        return (
-            f"drawtext=fontfile={font}:"
-            "text='%{localtime\\:%Y-%m-%d %H\\:%M\\:%S}':"
-            "fontcolor=white:fontsize=18:x=10:y=10,"
-            f"drawtext=fontfile={font}:"
-            "text='REC':fontcolor=red:fontsize=18:x=w-tw-10:y=10,"
-            f"drawtext=fontfile={font}:"
-            "text='CAM 01':fontcolor=white:fontsize=16:x=10:y=h-th-10"
-        )
-    return ""
+    return _OVERLAY_FILTERS.get(overlay_type, "")
 
 
 def build_colorshift_filter(shift_amount: int) -> str:
@@ -1,6 +1,7 @@
 """File metadata and introspection service using ffprobe."""
 
 import json
+import os
 import subprocess
 from pathlib import Path
 
@@ -35,16 +36,41 @@ def format_bitrate(bitrate: int) -> str:
     return f"{bitrate} bps"
 
 
-def get_file_duration(file_path: Path) -> int | None:
+# ffprobe results per file, keyed by the file's (mtime_ns, size)
+_duration_cache: dict[Path, tuple[tuple[int, int], int]] = {}
+_file_metadata_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def _probe_cache_key(
+    file_path: Path, stat_result: os.stat_result | None = None
+) -> tuple[int, int] | None:
+    """Get the (mtime_ns, size) cache key for file_path, or None if missing."""
+    if stat_result is None:
+        try:
+            stat_result = file_path.stat()
+        except OSError:
+            return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def get_file_duration(file_path: Path, stat_result: os.stat_result | None = None) -> int | None:
     """
     Get duration of audio/video file in milliseconds using ffprobe.
 
+    Successful probes are cached until the file's mtime or size changes.
+
     Args:
         file_path: Path to the media file
+        stat_result: The file's stat() result, if the caller already has it
 
     Returns:
         Duration in milliseconds, or None if detection fails.
     """
+    cache_key = _probe_cache_key(file_path, stat_result)
+    cached = _duration_cache.get(file_path)
+    if cached and cached[0] == cache_key:
+        return cached[1]
+
     cmd = [
         "ffprobe",
         "-v", "error",
@@ -57,30 +83,87 @@ def get_file_duration(file_path: Path) -> int | None:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
         if result.returncode == 0 and result.stdout.strip():
             duration_seconds = float(result.stdout.strip())
-            return int(duration_seconds * 1000)
+            duration_ms = int(duration_seconds * 1000)
+            if cache_key is not None:
+                _duration_cache[file_path] = (cache_key, duration_ms)
+            return duration_ms
     except (subprocess.TimeoutExpired, ValueError) as e:
         logger.warning(f"Failed to get duration for {file_path}: {e}")
 
     return None
 
 
+# get_input_files() scans per directory, keyed by the directory's mtime
+_input_files_cache: dict[Path, tuple[int, list[Path]]] = {}
+
+
+def invalidate_input_files_cache(input_dir: Path | None = None) -> None:
+    """Forget cached input directory scans (for one directory, or all).
+
+    Called by the upload and download writers, so a file they add within
+    the directory's mtime granularity is never missed.
+    """
+    if input_dir is None:
+        _input_files_cache.clear()
+    else:
+        _input_files_cache.pop(input_dir, None)
+
+
+def _sorted_by_mtime(files: list[Path]) -> list[Path]:
+    """Sort files newest first, dropping any that no longer exist."""
+    stamped = []
+    for path in files:
+        try:
+            stamped.append((path.stat().st_mtime_ns, path))
+        except FileNotFoundError:
+            continue
+    stamped.sort(key=lambda item: item[0], reverse=True)
+    return [path for _, path in stamped]
+
+
 def get_input_files(input_dir: Path) -> list[Path]:
-    """Get list of video/audio files in input directory."""
-    extensions = {".mp4", ".mkv", ".avi", ".mov", ".mp3", ".wav", ".flac"}
-    files = []
-    for ext in extensions:
-        files.extend(input_dir.glob(f"*{ext}"))
-    return sorted(files, key=lambda p: p.stat().st_mtime, reverse=True)
+    """Get list of video/audio files in input directory, newest first.
+
+    The directory scan is cached until the directory's mtime changes (a
+    file is added, removed or renamed) or the cache is invalidated. The
+    files are re-stat()ed on every call, since rewriting one in place
+    changes the order without touching the directory's mtime.
+    """
+    try:
+        dir_mtime = input_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
 
+    cached = _input_files_cache.get(input_dir)
+    if cached and cached[0] == dir_mtime:
+        files = cached[1]
+    else:
+        extensions = {".mp4", ".mkv", ".avi", ".mov", ".mp3", ".wav", ".flac"}
+        files = []
+        for ext in extensions:
+            files.extend(input_dir.glob(f"*{ext}"))
+        _input_files_cache[input_dir] = (dir_mtime, files)
 
-def get_file_metadata(file_path: Path) -> dict:
+    return _sorted_by_mtime(files)
+
+
+def get_file_metadata(file_path: Path, stat_result: os.stat_result | None = None) -> dict:
     """
     Get detailed metadata for audio/video file using ffprobe.
 
     Returns dict with: file_type, size_bytes, size_formatted, duration_ms,
     duration_formatted, codec_name, sample_rate, channels, bit_rate,
     and for video: width, height, frame_rate.
+
+    Results are cached until the file's mtime or size changes; callers get
+    a copy they are free to mutate. Pass stat_result if the caller has
+    already stat()ed the file.
     """
+    cache_key = _probe_cache_key(file_path, stat_result)
+    cached = _file_metadata_cache.get(file_path)
+    if cached and cached[0] == cache_key:
+        return dict(cached[1])
+
     metadata = {
         "filename": file_path.name,
         "file_type": "unknown",
@@ -89,8 +172,8 @@ def get_file_metadata(file_path: Path) -> dict:
     }
 
     # Get file size
-    if file_path.exists():
-        size = file_path.stat().st_size
+    if cache_key is not None:
+        size = cache_key[1]
         metadata["size_bytes"] = size
         metadata["size_formatted"] = format_file_size(size)
 
@@ -150,6 +233,9 @@ def get_file_metadata(file_path: Path) -> dict:
                     metadata["sample_rate"] = stream.get("sample_rate")
                     metadata["channels"] = stream.get("channels")
 
+            if cache_key is not None:
+                _file_metadata_cache[file_path] = (cache_key, dict(metadata))
+
     except (subprocess.TimeoutExpired, json.JSONDecodeError, ValueError) as e:
         logger.warning(f"Failed to get metadata for {file_path}: {e}")
 
@@ -1,5 +1,6 @@
 """Presets loader service - loads effect presets from YAML file."""
 
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -8,27 +9,29 @@ from loguru import logger
 from pydantic import ValidationError
 
 from app.models import (
-    # Audio configs
-    VolumeConfig,
-    TunnelConfig,
-    FrequencyConfig,
-    SpeedConfig,
-    PitchConfig,
-    NoiseReductionConfig,
-    CompressorConfig,
-    # Video configs
+    BlurConfig,
     BrightnessConfig,
+    CompressorConfig,
     ContrastConfig,
+    FrequencyConfig,
+    NoiseReductionConfig,
+    PitchConfig,
     SaturationConfig,
-    BlurConfig,
     SharpenConfig,
+    SpeedConfig,
     TransformConfig,
+    TunnelConfig,
+    UserSettings,
+    VolumeConfig,
 )
-
+from app.yaml_compat import SafeLoader
 
 # Global preset storage (populated on load)
 _presets: dict[str, dict[str, Any]] = {}
 
+# Flattened category -> presets view of _presets (rebuilt on load)
+_category_presets: dict[str, dict[str, Any]] = {}
+
 # Config class mapping for validation
 CONFIG_CLASSES = {
     "audio": {
@@ -65,7 +68,7 @@ def load_presets(presets_file: Path | str = "presets.yml") -> dict[str, dict[str
         yaml.YAMLError: If YAML parsing fails
         ValidationError: If preset data doesn't match schema
     """
-    global _presets
+    global _presets, _category_presets
 
     presets_path = Path(presets_file)
     if not presets_path.exists():
@@ -74,7 +77,7 @@ def load_presets(presets_file: Path | str = "presets.yml") -> dict[str, dict[str
     logger.info(f"Loading presets from {presets_path}")
 
     with open(presets_path, "r") as f:
-        raw_data = yaml.safe_load(f)
+        raw_data = yaml.load(f, Loader=SafeLoader)
 
     validated_presets = {"audio": {}, "video": {}}
 
@@ -89,7 +92,9 @@ def load_presets(presets_file: Path | str = "presets.yml") -> dict[str, dict[str
         for preset_key, preset_data in raw_data["audio"][category].items():
             try:
                 validated = config_class(**preset_data)
-                category_presets[preset_key] = validated
+                # Interned so keys repeated across categories (e.g. "none")
+                # share one string object
+                category_presets[sys.intern(preset_key)] = validated
             except ValidationError as e:
                 logger.error(f"Invalid preset {category}/{preset_key}: {e}")
                 raise
@@ -108,7 +113,9 @@ def load_presets(presets_file: Path | str = "presets.yml") -> dict[str, dict[str
         for preset_key, preset_data in raw_data["video"][category].items():
             try:
                 validated = config_class(**preset_data)
-                category_presets[preset_key] = validated
+                # Interned so keys repeated across categories (e.g. "none")
+                # share one string object
+                category_presets[sys.intern(preset_key)] = validated
             except ValidationError as e:
                 logger.error(f"Invalid preset {category}/{preset_key}: {e}")
                 raise
@@ -130,6 +137,7 @@ def load_presets(presets_file: Path | str = "presets.yml") -> dict[str, dict[str
         logger.warning(f"Failed to load user presets: {e}")
 
     _presets = validated_presets
+    _category_presets = {**validated_presets["audio"], **validated_presets["video"]}
 
     total = sum(
         len(presets)
@@ -226,6 +234,43 @@ def get_presets_by_preset_category(filter_type: str, filter_category: str) -> di
     return dict(sorted(grouped.items(), key=lambda x: sort_key(x[0])))
 
 
+def get_category_presets() -> dict[str, dict[str, Any]]:
+    """Get preset dictionaries for every audio and video category.
+
+    The mapping is built once per load, so callers may cache data derived
+    from it until a different object is returned (after reload_presets()).
+
+    Returns:
+        Dictionary of category -> (preset_key -> config), audio categories first
+    """
+    get_presets()
+    return _category_presets
+
+
+def resolve_current_presets(
+    user_settings: UserSettings,
+    category_presets: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Resolve the selected preset config for each category.
+
+    Falls back to the category's "none" preset when the saved key is unknown.
+
+    Args:
+        user_settings: Settings holding the selected preset key per category
+        category_presets: Result of get_category_presets(), fetched if omitted
+
+    Returns:
+        Dictionary of category -> current preset config
+    """
+    if category_presets is None:
+        category_presets = get_category_presets()
+
+    return {
+        category: presets.get(getattr(user_settings, category).preset) or presets.get("none")
+        for category, presets in category_presets.items()
+    }
+
+
 # Convenience accessors for common use
 def get_volume_presets() -> dict[str, VolumeConfig]:
     return get_audio_presets("volume")
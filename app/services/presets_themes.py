@@ -7,8 +7,8 @@ import yaml
 from loguru import logger
 from pydantic import ValidationError
 
-from app.models import ThemePreset, FilterStep
-
+from app.models import FilterStep, ThemePreset
+from app.yaml_compat import SafeLoader
 
 # Global theme preset storage
 _theme_presets: dict[str, dict[str, ThemePreset]] = {}
@@ -37,7 +37,7 @@ def load_theme_presets(presets_file: Path | str | None = None) -> dict[str, dict
     logger.info(f"Loading theme presets from {presets_path}")
 
     with open(presets_path, "r") as f:
-        raw_data = yaml.safe_load(f) or {}
+        raw_data = yaml.load(f, Loader=SafeLoader) or {}
 
     validated_presets = {"audio": {}, "video": {}}
 
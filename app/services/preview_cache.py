@@ -0,0 +1,135 @@
+"""Cache of generated preview clips.
+
+Preview files live in a dedicated directory that is emptied at startup and
+shutdown. Entries are evicted oldest-first once the cache exceeds its entry
+or byte limit, but a file is only removed once no response is still sending
+it. Concurrent requests for the same key share one generation run.
+"""
+
+import asyncio
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+
+@dataclass(slots=True, eq=False)
+class PreviewEntry:
+    """A cached preview file and the responses currently using it."""
+
+    path: Path
+    size: int = 0
+    users: int = 0
+    evicted: bool = False
+    task: asyncio.Future | None = field(default=None, repr=False)
+
+
+class PreviewCache:
+    """Size-bounded cache of preview files, keyed by the caller."""
+
+    def __init__(self, directory: Path, max_entries: int, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: OrderedDict[Hashable, PreviewEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def new_path(self, suffix: str) -> Path:
+        """Create an empty, uniquely named file in the preview directory."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(suffix=suffix, dir=self.directory)
+        os.close(fd)
+        return Path(name)
+
+    def clear(self) -> None:
+        """Forget every entry and empty the preview directory."""
+        self._entries.clear()
+        self.total_bytes = 0
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.iterdir():
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove preview file {path}: {e}")
+
+    async def acquire(
+        self,
+        key: Hashable,
+        suffix: str,
+        generate: Callable[[Path], Awaitable[None]],
+    ) -> PreviewEntry:
+        """Get the preview for key, generating it with generate(path) if needed.
+
+        The returned entry is held until release() is called, typically once
+        the response has finished sending. Errors raised by generate() reach
+        every request waiting on the same key.
+        """
+        entry = self._entries.get(key)
+        if entry is None or (entry.task.done() and not entry.path.exists()):
+            if entry is not None:
+                self._discard(key, entry)
+            entry = PreviewEntry(path=self.new_path(suffix))
+            entry.task = asyncio.ensure_future(self._fill(key, entry, generate))
+            self._entries[key] = entry
+        else:
+            self._entries.move_to_end(key)
+
+        entry.users += 1
+        try:
+            # Shielded so one client disconnecting doesn't cancel a run
+            # other requests are waiting on
+            await asyncio.shield(entry.task)
+        except BaseException:
+            self.release(entry)
+            raise
+        return entry
+
+    def release(self, entry: PreviewEntry) -> None:
+        """Stop using entry, removing its file if it has been evicted."""
+        entry.users -= 1
+        if entry.evicted and entry.users <= 0:
+            entry.path.unlink(missing_ok=True)
+
+    async def _fill(
+        self,
+        key: Hashable,
+        entry: PreviewEntry,
+        generate: Callable[[Path], Awaitable[None]],
+    ) -> None:
+        try:
+            await generate(entry.path)
+            entry.size = entry.path.stat().st_size
+        except BaseException:
+            self._discard(key, entry)
+            raise
+        self.total_bytes += entry.size
+        self._evict(entry)
+
+    def _discard(self, key: Hashable, entry: PreviewEntry) -> None:
+        """Drop entry from the cache; its file goes once nobody uses it."""
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+            self.total_bytes -= entry.size
+        entry.evicted = True
+        if entry.users <= 0:
+            entry.path.unlink(missing_ok=True)
+
+    def _evict(self, filled: PreviewEntry) -> None:
+        """Evict the oldest generated entries while over either limit.
+
+        filled (just generated) counts as generated, so a single preview
+        larger than max_bytes doesn't stay cached.
+        """
+        for key, entry in list(self._entries.items()):
+            if len(self._entries) <= self.max_entries and self.total_bytes <= self.max_bytes:
+                break
+            if entry is filled or entry.task.done():
+                self._discard(key, entry)
@@ -375,15 +375,15 @@ def process_video_with_progress(
     stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
     stderr_thread.start()
 
-    # Yield initial status
-    yield {
-        "type": "status",
-        "message": "Starting FFmpeg processing...",
-    }
-
     # Parse FFmpeg progress output
     current_time_ms = 0
     try:
+        # Yield initial status
+        yield {
+            "type": "status",
+            "message": "Starting FFmpeg processing...",
+        }
+
         for line in process.stdout:
             line = line.strip()
 
@@ -441,3 +441,8 @@ def process_video_with_progress(
             "message": str(e),
         }
         raise
+    finally:
+        # Also reached on close() (client gone), which except Exception misses
+        if process.poll() is None:
+            process.kill()
+            process.wait()
@@ -29,25 +29,25 @@ def load_user_settings(filename: str | None = None) -> UserSettings:
         settings_data = get_file_settings(filename)
 
         return UserSettings(
-            volume=CategorySettings(**settings_data.get("volume", {"preset": "none"})),
-            tunnel=CategorySettings(**settings_data.get("tunnel", {"preset": "none"})),
-            frequency=CategorySettings(**settings_data.get("frequency", {"preset": "none"})),
-            speed=CategorySettings(**settings_data.get("speed", {"preset": "none"})),
-            pitch=CategorySettings(**settings_data.get("pitch", {"preset": "none"})),
-            noise_reduction=CategorySettings(**settings_data.get("noise_reduction", {"preset": "none"})),
-            compressor=CategorySettings(**settings_data.get("compressor", {"preset": "none"})),
+            volume=CategorySettings.from_dict(settings_data.get("volume", {"preset": "none"})),
+            tunnel=CategorySettings.from_dict(settings_data.get("tunnel", {"preset": "none"})),
+            frequency=CategorySettings.from_dict(settings_data.get("frequency", {"preset": "none"})),
+            speed=CategorySettings.from_dict(settings_data.get("speed", {"preset": "none"})),
+            pitch=CategorySettings.from_dict(settings_data.get("pitch", {"preset": "none"})),
+            noise_reduction=CategorySettings.from_dict(settings_data.get("noise_reduction", {"preset": "none"})),
+            compressor=CategorySettings.from_dict(settings_data.get("compressor", {"preset": "none"})),
             # Video effects
-            brightness=CategorySettings(**settings_data.get("brightness", {"preset": "none"})),
-            contrast=CategorySettings(**settings_data.get("contrast", {"preset": "none"})),
-            saturation=CategorySettings(**settings_data.get("saturation", {"preset": "none"})),
-            blur=CategorySettings(**settings_data.get("blur", {"preset": "none"})),
-            sharpen=CategorySettings(**settings_data.get("sharpen", {"preset": "none"})),
-            transform=CategorySettings(**settings_data.get("transform", {"preset": "none"})),
+            brightness=CategorySettings.from_dict(settings_data.get("brightness", {"preset": "none"})),
+            contrast=CategorySettings.from_dict(settings_data.get("contrast", {"preset": "none"})),
+            saturation=CategorySettings.from_dict(settings_data.get("saturation", {"preset": "none"})),
+            blur=CategorySettings.from_dict(settings_data.get("blur", {"preset": "none"})),
+            sharpen=CategorySettings.from_dict(settings_data.get("sharpen", {"preset": "none"})),
+            transform=CategorySettings.from_dict(settings_data.get("transform", {"preset": "none"})),
             # Theme-only video effects
-            crop=CategorySettings(**settings_data.get("crop", {"preset": "none"})),
-            colorshift=CategorySettings(**settings_data.get("colorshift", {"preset": "none"})),
-            overlay=CategorySettings(**settings_data.get("overlay", {"preset": "none"})),
-            scale=CategorySettings(**settings_data.get("scale", {"preset": "none"})),
+            crop=CategorySettings.from_dict(settings_data.get("crop", {"preset": "none"})),
+            colorshift=CategorySettings.from_dict(settings_data.get("colorshift", {"preset": "none"})),
+            overlay=CategorySettings.from_dict(settings_data.get("overlay", {"preset": "none"})),
+            scale=CategorySettings.from_dict(settings_data.get("scale", {"preset": "none"})),
             active_category=settings_data.get("active_category", ""),
             active_tab=settings_data.get("active_tab", "audio"),
             video_theme_chain=settings_data.get("video_theme_chain", []),
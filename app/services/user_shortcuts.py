@@ -10,7 +10,7 @@ from pydantic import ValidationError
 
 from app.config import DATA_DIR
 from app.services.presets import CONFIG_CLASSES
-
+from app.yaml_compat import SafeLoader
 
 USER_PRESETS_FILE = DATA_DIR / "user-presets.yml"
 
@@ -29,7 +29,7 @@ def load_user_shortcuts() -> dict[str, dict[str, dict[str, Any]]]:
     logger.debug(f"Loading user presets from {USER_PRESETS_FILE}")
 
     with open(USER_PRESETS_FILE, "r") as f:
-        raw_data = yaml.safe_load(f) or {}
+        raw_data = yaml.load(f, Loader=SafeLoader) or {}
 
     validated_presets = {"audio": {}, "video": {}}
 
@@ -96,7 +96,7 @@ def _load_raw_user_presets() -> dict:
     if not USER_PRESETS_FILE.exists():
         return {"audio": {}, "video": {}}
     with open(USER_PRESETS_FILE, "r") as f:
-        return yaml.safe_load(f) or {"audio": {}, "video": {}}
+        return yaml.load(f, Loader=SafeLoader) or {"audio": {}, "video": {}}
 
 
 def generate_shortcut_key(name: str) -> str:
@@ -301,7 +301,7 @@ def import_shortcuts(yaml_content: str, merge: bool = True) -> dict:
     result = {"added": 0, "updated": 0, "skipped": 0, "errors": []}
 
     try:
-        import_data = yaml.safe_load(yaml_content)
+        import_data = yaml.load(yaml_content, Loader=SafeLoader)
     except yaml.YAMLError as e:
         result["errors"].append(f"Invalid YAML: {e}")
         return result
@@ -0,0 +1,28 @@
+"""Shared Jinja2 templates for the app and its routers."""
+
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from app.config import JINJA_CACHE_DIR, config
+
+
+def configure_templates(
+    templates: Jinja2Templates, reload: bool, bytecode_dir: Path = JINJA_CACHE_DIR
+) -> None:
+    """Set up template caching for dev (reload) or production mode.
+
+    Outside dev mode, skip per-render template stat() checks, reuse compiled
+    template bytecode across restarts and compile every template up front.
+    """
+    templates.env.auto_reload = reload
+    if reload:
+        return
+    templates.env.bytecode_cache = FileSystemBytecodeCache(str(bytecode_dir))
+    for template_name in templates.env.list_templates(extensions=["html"]):
+        templates.get_template(template_name)
+
+
+templates = Jinja2Templates(directory="app/templates")
+configure_templates(templates, config.server.reload)
@@ -0,0 +1,9 @@
+"""libyaml-backed YAML loader/dumper with a pure-Python fallback."""
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+__all__ = ["SafeDumper", "SafeLoader"]
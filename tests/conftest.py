@@ -19,6 +19,17 @@ def presets_path() -> Path:
     return Path(__file__).parent.parent / "presets.yml"
 
 
+@pytest.fixture
+def metadata_dir(tmp_path, monkeypatch) -> Path:
+    """Point per-file metadata at an empty temporary input directory."""
+    from app.services import file_metadata
+
+    monkeypatch.setattr(file_metadata, "INPUT_DIR", tmp_path)
+    file_metadata._metadata_cache.clear()
+    yield tmp_path
+    file_metadata._metadata_cache.clear()
+
+
 # =============================================================================
 # Audio Integration Test Fixtures
 # =============================================================================
@@ -0,0 +1,82 @@
+"""Tests for the ffmpeg concurrency limits in the audio router."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.config import AudioConfig
+from app.routers import audio
+from app.services import processor
+
+
+def test_default_is_computed_at_startup():
+    """The config default stays None; the slot count is resolved at import."""
+    assert AudioConfig().max_concurrent_ffmpeg is None
+    assert audio.FFMPEG_SLOTS >= 1
+
+
+def test_preview_waits_are_bounded(monkeypatch):
+    """With every preview slot taken, a preview fails fast with 503."""
+    monkeypatch.setattr(audio, "_PREVIEW_SEMAPHORE", asyncio.Semaphore(0))
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(audio._run_ffmpeg(["ffmpeg", "-version"], timeout=0.01))
+    assert exc_info.value.status_code == 503
+
+
+
+def test_closing_progress_generator_kills_ffmpeg(monkeypatch, tmp_path):
+    """Closing the render generator early (client gone) stops ffmpeg."""
+    started = []
+    real_popen = processor.subprocess.Popen
+
+    def fake_popen(cmd, **kwargs):
+        proc = real_popen(["sh", "-c", "echo out_time_ms=1000; exec sleep 30"], **kwargs)
+        started.append(proc)
+        return proc
+
+    monkeypatch.setattr(processor.subprocess, "Popen", fake_popen)
+    progress = processor.process_video_with_progress(
+        input_file=tmp_path / "in.mp4",
+        start_time="0",
+        end_time="1",
+        total_duration_ms=2000,
+    )
+    try:
+        assert next(progress)["type"] == "status"
+        assert next(progress)["type"] == "progress"
+
+        audio._close_generator(progress)
+
+        assert started[0].poll() is not None
+    finally:
+        for proc in started:
+            proc.kill()
+            proc.wait()
+
+
+def test_close_generator_waits_for_running_step():
+    """A step still running in a worker thread is waited out, then closed."""
+    release = threading.Event()
+    closed = []
+
+    def slow_gen():
+        try:
+            release.wait()
+            yield 1
+            yield 2
+        finally:
+            closed.append(True)
+
+    gen = slow_gen()
+    worker = threading.Thread(target=next, args=(gen,))
+    worker.start()
+    time.sleep(0.05)
+    threading.Timer(0.1, release.set).start()
+
+    audio._close_generator(gen)
+    worker.join()
+    assert closed == [True]
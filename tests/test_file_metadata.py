@@ -0,0 +1,79 @@
+"""Tests for the per-file metadata cache."""
+
+import os
+
+import yaml
+
+from app.services import file_metadata
+from app.services.file_metadata import (
+    get_file_settings,
+    load_file_metadata,
+    save_file_metadata,
+)
+
+
+def _write(path, data: dict) -> None:
+    path.write_text(yaml.safe_dump(data, sort_keys=False))
+
+
+class TestMetadataCache:
+    """Tests for load_file_metadata() caching and invalidation."""
+
+    def test_missing_file_returns_defaults(self, metadata_dir):
+        metadata = load_file_metadata("clip.mp4")
+        assert metadata["history"] == []
+        assert metadata["settings"]["tunnel"]["preset"] == "none"
+        assert not file_metadata._metadata_cache
+
+    def test_parse_is_cached(self, metadata_dir, monkeypatch):
+        _write(metadata_dir / "clip.yml", {"source": {"title": "A"}})
+        load_file_metadata("clip.mp4")
+
+        monkeypatch.setattr(file_metadata.yaml, "load", lambda *a, **k: 1 / 0)
+        assert load_file_metadata("clip.mp4")["source"]["title"] == "A"
+
+    def test_external_edit_is_picked_up(self, metadata_dir):
+        meta_path = metadata_dir / "clip.yml"
+        _write(meta_path, {"source": {"title": "A"}})
+        assert load_file_metadata("clip.mp4")["source"]["title"] == "A"
+
+        _write(meta_path, {"source": {"title": "Longer title"}})
+        assert load_file_metadata("clip.mp4")["source"]["title"] == "Longer title"
+
+    def test_save_invalidates_within_same_tick(self, metadata_dir):
+        """A save is seen even if mtime and size don't change."""
+        meta_path = metadata_dir / "clip.yml"
+        _write(meta_path, {"source": {"title": "A"}})
+        stat = meta_path.stat()
+        load_file_metadata("clip.mp4")
+
+        assert save_file_metadata("clip.mp4", {"source": {"title": "B"}})
+        os.utime(meta_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert meta_path.stat().st_size == stat.st_size
+
+        assert load_file_metadata("clip.mp4")["source"]["title"] == "B"
+
+    def test_load_returns_isolated_copy(self, metadata_dir):
+        _write(metadata_dir / "clip.yml", {"history": [{"id": "1"}]})
+
+        first = load_file_metadata("clip.mp4")
+        first["history"].append({"id": "2"})
+        first["source"]["title"] = "mutated"
+
+        second = load_file_metadata("clip.mp4")
+        assert second["history"] == [{"id": "1"}]
+        assert second["source"] == {}
+
+    def test_settings_returns_isolated_copy(self, metadata_dir):
+        _write(metadata_dir / "clip.yml", {
+            "settings": {"tunnel": {"preset": "heavy", "custom_values": {}}},
+        })
+
+        settings = get_file_settings("clip.mp4")
+        settings["tunnel"]["custom_values"]["delays"] = "10"
+
+        assert get_file_settings("clip.mp4")["tunnel"]["custom_values"] == {}
+
+    def test_defaults_are_not_shared(self, metadata_dir):
+        get_file_settings("missing.mp4")["tunnel"]["preset"] = "heavy"
+        assert get_file_settings("missing.mp4")["tunnel"]["preset"] == "none"
@@ -0,0 +1,46 @@
+"""Tests for the routes that serve input and output files."""
+
+import os
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.routers import audio
+
+
+@pytest.fixture
+def serve_dir(tmp_path, monkeypatch) -> Path:
+    """Serve both input and output files from one temporary directory."""
+    monkeypatch.setattr(audio, "INPUT_DIR", tmp_path)
+    monkeypatch.setattr(audio, "OUTPUT_DIR", tmp_path)
+    (tmp_path / "clip.mp3").write_bytes(b"mp3 data")
+    (tmp_path / "subdir").mkdir()
+    os.symlink("loop", tmp_path / "loop")
+    return tmp_path
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(main.app)
+
+
+@pytest.mark.parametrize("route", ["/preview", "/input"])
+class TestServedFiles:
+    """Tests for GET /preview/{filename} and /input/{filename}."""
+
+    def test_regular_file_served(self, client, serve_dir, route):
+        response = client.get(f"{route}/clip.mp3")
+        assert response.status_code == 200
+        assert response.content == b"mp3 data"
+
+    @pytest.mark.parametrize("name", ["missing.mp3", "subdir", "loop", "clip.mp3/x"])
+    def test_unservable_paths_are_not_found(self, client, serve_dir, route, name):
+        assert client.get(f"{route}/{name}").status_code == 404
+
+
+@pytest.mark.parametrize("name", ["missing.mp3", "subdir", "loop"])
+def test_clip_preview_unservable_input_not_found(client, serve_dir, name):
+    response = client.get("/clip-preview", params={"filename": name, "start": "0", "end": "1"})
+    assert response.status_code == 404
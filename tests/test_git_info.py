@@ -0,0 +1,104 @@
+"""Tests for reading the running commit from .git."""
+
+import subprocess
+import zlib
+from pathlib import Path
+
+import pytest
+
+from app import main
+from app.main import _read_git_head
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+# 2023-11-14 22:13:20 UTC, which is already 2023-11-15 at +0200
+COMMITTER = b"committer Dev <dev@example.com> 1700000000 +0200"
+
+
+def _write_commit(git_dir: Path, sha: str = SHA) -> None:
+    body = b"tree " + b"f" * 40 + b"\n" + COMMITTER + b"\n\nmessage\n"
+    obj = b"commit %d\x00" % len(body) + body
+    obj_path = git_dir / "objects" / sha[:2] / sha[2:]
+    obj_path.parent.mkdir(parents=True)
+    obj_path.write_bytes(zlib.compress(obj))
+
+
+@pytest.fixture
+def git_dir(tmp_path) -> Path:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    _write_commit(git_dir)
+    return git_dir
+
+
+class TestReadGitHead:
+    """Tests for _read_git_head()."""
+
+    def test_loose_ref(self, git_dir):
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "refs" / "heads" / "main").write_text(SHA + "\n")
+        assert _read_git_head(git_dir) == ("0123456", "2023.11.15")
+
+    def test_packed_ref(self, git_dir):
+        (git_dir / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n"
+            f"{'a' * 40} refs/heads/other\n"
+            f"{SHA} refs/heads/main\n"
+        )
+        assert _read_git_head(git_dir) == ("0123456", "2023.11.15")
+
+    def test_detached_head(self, git_dir):
+        (git_dir / "HEAD").write_text(SHA + "\n")
+        assert _read_git_head(git_dir) == ("0123456", "2023.11.15")
+
+    def test_packed_object_returns_none(self, git_dir):
+        (git_dir / "HEAD").write_text("b" * 40 + "\n")
+        assert _read_git_head(git_dir) is None
+
+    def test_unknown_ref_returns_none(self, git_dir):
+        (git_dir / "packed-refs").write_text(f"{SHA} refs/heads/other\n")
+        assert _read_git_head(git_dir) is None
+
+    def test_not_a_repository(self, tmp_path):
+        assert _read_git_head(tmp_path / ".git") is None
+
+
+class TestGetGitInfo:
+    """Tests for _get_git_info() precedence and fallbacks."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self, monkeypatch):
+        monkeypatch.delenv("GIT_HASH", raising=False)
+        monkeypatch.delenv("GIT_DATE", raising=False)
+        main._get_git_info.cache_clear()
+        yield
+        main._get_git_info.cache_clear()
+
+    def test_build_args_win(self, monkeypatch):
+        monkeypatch.setenv("GIT_HASH", "abc1234")
+        monkeypatch.setenv("GIT_DATE", "2024.01.02")
+        monkeypatch.setattr(main, "_read_git_head", lambda: pytest.fail("read .git"))
+        assert main._get_git_info() == ("abc1234", "2024.01.02")
+
+    def test_reads_git_dir(self, monkeypatch):
+        monkeypatch.setenv("GIT_HASH", "dev")
+        monkeypatch.setattr(main, "_read_git_head", lambda: ("0123456", "2023.11.15"))
+        monkeypatch.setattr(main.subprocess, "run", lambda *a, **k: pytest.fail("ran git"))
+        assert main._get_git_info() == ("0123456", "2023.11.15")
+
+    def test_falls_back_to_git(self, monkeypatch):
+        monkeypatch.setattr(main, "_read_git_head", lambda: None)
+        monkeypatch.setattr(
+            main.subprocess,
+            "run",
+            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, "fedcba9|2022.05.06\n", ""),
+        )
+        assert main._get_git_info() == ("fedcba9", "2022.05.06")
+
+    def test_no_git_at_all(self, monkeypatch):
+        def missing_git(*args, **kwargs):
+            raise FileNotFoundError("git")
+
+        monkeypatch.setattr(main, "_read_git_head", lambda: None)
+        monkeypatch.setattr(main.subprocess, "run", missing_git)
+        assert main._get_git_info() == ("dev", "")
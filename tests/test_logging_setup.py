@@ -0,0 +1,60 @@
+"""Tests for routing standard logging through loguru."""
+
+import logging
+
+import pytest
+from loguru import logger
+
+from app import logging_setup
+from app.logging_setup import InterceptHandler
+
+
+@pytest.fixture
+def records(monkeypatch):
+    """Capture loguru records from a std logger wired to InterceptHandler."""
+    monkeypatch.setattr(logging_setup, "_min_sink_level", 0)
+    logging_setup._DEPTH_CACHE.clear()
+    captured = []
+    sink_id = logger.add(captured.append, level=0, format="{message}")
+    yield captured
+    logger.remove(sink_id)
+    logging_setup._DEPTH_CACHE.clear()
+
+
+@pytest.fixture
+def std_logger() -> logging.Logger:
+    log = logging.getLogger("tests.intercept")
+    log.handlers = [InterceptHandler()]
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    return log
+
+
+def test_records_attributed_to_call_site(records, std_logger):
+    """Cached and uncached depths both point loguru at the caller."""
+    for i in range(2):
+        std_logger.info("message %d", i)
+
+    assert [r.record["message"] for r in records] == ["message 0", "message 1"]
+    for r in records:
+        assert r.record["function"] == "test_records_attributed_to_call_site"
+        assert r.record["name"] == __name__
+    assert len(logging_setup._DEPTH_CACHE) == 1
+
+
+def test_each_call_site_cached_separately(records, std_logger):
+    std_logger.warning("one")
+    std_logger.warning("two")
+
+    assert len(logging_setup._DEPTH_CACHE) == 2
+    assert records[0].record["line"] != records[1].record["line"]
+
+
+def test_records_below_sink_level_skipped(records, std_logger, monkeypatch):
+    monkeypatch.setattr(logging_setup, "_min_sink_level", logging.WARNING)
+
+    std_logger.info("dropped")
+    std_logger.error("kept")
+
+    assert [r.record["message"] for r in records] == ["kept"]
+    assert records[0].record["level"].name == "ERROR"
@@ -0,0 +1,178 @@
+"""Tests for input file listing and ffprobe result caching."""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from app.services import metadata
+from app.services.metadata import (
+    get_file_duration,
+    get_file_metadata,
+    get_input_files,
+    invalidate_input_files_cache,
+)
+
+
+def _touch(path: Path, mtime: int) -> None:
+    """Create path (if needed) and set its mtime to the given second."""
+    path.touch()
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def input_dir(tmp_path) -> Path:
+    """Input directory with two media files and one non-media file."""
+    _touch(tmp_path / "old.mp4", 1_000)
+    _touch(tmp_path / "new.wav", 2_000)
+    _touch(tmp_path / "old.yml", 3_000)
+    invalidate_input_files_cache()
+    yield tmp_path
+    invalidate_input_files_cache()
+
+
+def _pin_dir_mtime(directory: Path) -> None:
+    """Reset the directory mtime, as if changes landed in the same tick."""
+    os.utime(directory, (5_000, 5_000))
+
+
+class TestGetInputFiles:
+    """Tests for get_input_files()."""
+
+    def test_lists_media_newest_first(self, input_dir):
+        assert get_input_files(input_dir) == [input_dir / "new.wav", input_dir / "old.mp4"]
+
+    def test_missing_directory(self, tmp_path):
+        assert get_input_files(tmp_path / "missing") == []
+
+    def test_returns_copy(self, input_dir):
+        get_input_files(input_dir).clear()
+        assert len(get_input_files(input_dir)) == 2
+
+    def test_in_place_rewrite_reorders(self, input_dir):
+        """Rewriting a file doesn't touch the directory mtime but changes order."""
+        _pin_dir_mtime(input_dir)
+        get_input_files(input_dir)
+
+        _touch(input_dir / "old.mp4", 4_000)
+        _pin_dir_mtime(input_dir)
+
+        assert get_input_files(input_dir)[0] == input_dir / "old.mp4"
+
+    def test_directory_change_rescans(self, input_dir):
+        get_input_files(input_dir)
+        _touch(input_dir / "added.mp3", 3_000)
+        os.utime(input_dir, (6_000, 6_000))
+
+        assert get_input_files(input_dir)[0] == input_dir / "added.mp3"
+
+    def test_same_tick_addition_needs_invalidation(self, input_dir):
+        """Writers invalidate explicitly so same-tick additions are not missed."""
+        _pin_dir_mtime(input_dir)
+        get_input_files(input_dir)
+
+        _touch(input_dir / "added.mp3", 3_000)
+        _pin_dir_mtime(input_dir)
+        assert input_dir / "added.mp3" not in get_input_files(input_dir)
+
+        invalidate_input_files_cache(input_dir)
+        assert get_input_files(input_dir)[0] == input_dir / "added.mp3"
+
+    def test_deleted_file_dropped(self, input_dir):
+        _pin_dir_mtime(input_dir)
+        get_input_files(input_dir)
+
+        (input_dir / "new.wav").unlink()
+        _pin_dir_mtime(input_dir)
+
+        assert get_input_files(input_dir) == [input_dir / "old.mp4"]
+
+    def test_scan_is_cached(self, input_dir, monkeypatch):
+        get_input_files(input_dir)
+        monkeypatch.setattr(Path, "glob", lambda *args: pytest.fail("rescanned"))
+        assert len(get_input_files(input_dir)) == 2
+        assert input_dir in metadata._input_files_cache
+
+
+class FakeProbe:
+    """Stand-in for subprocess.run that records ffprobe invocations."""
+
+    def __init__(self, stdout: str, returncode: int = 0):
+        self.stdout = stdout
+        self.returncode = returncode
+        self.calls = 0
+
+    def __call__(self, cmd, **kwargs):
+        self.calls += 1
+        return subprocess.CompletedProcess(cmd, self.returncode, self.stdout, "")
+
+
+PROBE_JSON = json.dumps({
+    "format": {"duration": "1.5", "bit_rate": "128000"},
+    "streams": [
+        {"codec_type": "audio", "codec_name": "mp3", "sample_rate": "44100", "channels": 2},
+    ],
+})
+
+
+@pytest.fixture
+def media_file(tmp_path) -> Path:
+    path = tmp_path / "clip.mp3"
+    path.write_bytes(b"x" * 10)
+    metadata._duration_cache.clear()
+    metadata._file_metadata_cache.clear()
+    yield path
+    metadata._duration_cache.clear()
+    metadata._file_metadata_cache.clear()
+
+
+class TestProbeCache:
+    """Tests for get_file_duration() and get_file_metadata() caching."""
+
+    def test_duration_cached_until_file_changes(self, media_file, monkeypatch):
+        probe = FakeProbe("1.5\n")
+        monkeypatch.setattr(metadata.subprocess, "run", probe)
+
+        assert get_file_duration(media_file) == 1500
+        assert get_file_duration(media_file, media_file.stat()) == 1500
+        assert probe.calls == 1
+
+        media_file.write_bytes(b"x" * 20)
+        probe.stdout = "2.0\n"
+        assert get_file_duration(media_file) == 2000
+        assert probe.calls == 2
+
+    def test_failed_duration_not_cached(self, media_file, monkeypatch):
+        probe = FakeProbe("", returncode=1)
+        monkeypatch.setattr(metadata.subprocess, "run", probe)
+
+        assert get_file_duration(media_file) is None
+        assert get_file_duration(media_file) is None
+        assert probe.calls == 2
+
+    def test_file_metadata_cached_and_copied(self, media_file, monkeypatch):
+        probe = FakeProbe(PROBE_JSON)
+        monkeypatch.setattr(metadata.subprocess, "run", probe)
+
+        first = get_file_metadata(media_file)
+        assert first["duration_ms"] == 1500
+        assert first["audio_codec"] == "mp3"
+        first["uploader"] = "added by caller"
+
+        second = get_file_metadata(media_file)
+        assert probe.calls == 1
+        assert "uploader" not in second
+        assert second["size_bytes"] == 10
+
+    def test_file_metadata_reprobed_after_change(self, media_file, monkeypatch):
+        probe = FakeProbe(PROBE_JSON)
+        monkeypatch.setattr(metadata.subprocess, "run", probe)
+
+        get_file_metadata(media_file)
+        stat = media_file.stat()
+        os.utime(media_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert get_file_metadata(media_file)["size_bytes"] == 10
+        assert probe.calls == 2
@@ -3,7 +3,14 @@
 import pytest
 from pydantic import ValidationError
 
-from app.models import SpeedConfig, PitchConfig, NoiseReductionConfig
+from app.models import (
+    PRESETS,
+    NoiseReductionConfig,
+    PitchConfig,
+    PresetLevel,
+    SpeedConfig,
+    TunnelConfig,
+)
 
 
 class TestSpeedConfig:
@@ -178,3 +185,28 @@ class TestNoiseReductionConfig:
                 name="Invalid", description="Bad reduction",
                 noise_floor=-40.0, noise_reduction=1.5
             )
+
+
+class TestTunnelConfig:
+    """Tests for TunnelConfig model."""
+
+    def test_delays_and_decays_str(self):
+        """Pipe-joined strings match the list fields."""
+        config = TunnelConfig(
+            name="Test",
+            description="Test",
+            delays=[15, 25, 35],
+            decays=[0.35, 0.3, 0.25],
+        )
+        assert config.delays_str == "15|25|35"
+        assert config.decays_str == "0.35|0.3|0.25"
+
+    def test_legacy_preset_strings(self):
+        """Legacy PRESETS expose the same string form."""
+        assert PRESETS[PresetLevel.MEDIUM].delays_str == "15|25|35|50"
+        assert PRESETS[PresetLevel.NONE].decays_str == "0.0"
+
+    def test_legacy_presets_lookup_by_string(self):
+        """Legacy PRESETS can be indexed with the raw preset string."""
+        assert PRESETS.get("medium") is PRESETS[PresetLevel.MEDIUM]
+        assert PRESETS.get("unknown") is None
@@ -3,8 +3,16 @@
 import pytest
 from pathlib import Path
 
-from app.services.presets import load_presets, get_speed_presets, get_pitch_presets, get_noise_reduction_presets
-from app.models import SpeedConfig, PitchConfig, NoiseReductionConfig
+from app.services.presets import (
+    load_presets,
+    get_speed_presets,
+    get_pitch_presets,
+    get_noise_reduction_presets,
+    get_tunnel_presets,
+    get_category_presets,
+    resolve_current_presets,
+)
+from app.models import SpeedConfig, PitchConfig, NoiseReductionConfig, UserSettings, CategorySettings
 
 
 class TestLoadPresets:
@@ -22,6 +30,33 @@ class TestLoadPresets:
         assert presets_path.exists(), f"presets.yml not found at {presets_path}"
 
 
+class TestResolveCurrentPresets:
+    """Tests for per-category current preset resolution."""
+
+    def test_defaults_resolve_to_none_presets(self, presets_path):
+        """Test default settings resolve every category to its "none" preset."""
+        load_presets(presets_path)
+        category_presets = get_category_presets()
+        current = resolve_current_presets(UserSettings(), category_presets)
+        assert current.keys() == category_presets.keys()
+        for category, config in current.items():
+            assert config is category_presets[category]["none"]
+
+    def test_selected_preset_is_resolved(self, presets_path):
+        """Test a saved preset key resolves to its config."""
+        load_presets(presets_path)
+        key = next(k for k in get_tunnel_presets() if k != "none")
+        settings = UserSettings(tunnel=CategorySettings(preset=key))
+        assert resolve_current_presets(settings)["tunnel"] is get_tunnel_presets()[key]
+
+    def test_unknown_preset_falls_back_to_none(self, presets_path):
+        """Test an unknown preset key falls back to "none"."""
+        load_presets(presets_path)
+        settings = UserSettings(volume=CategorySettings(preset="does_not_exist"))
+        current = resolve_current_presets(settings)
+        assert current["volume"] is get_category_presets()["volume"]["none"]
+
+
 class TestSpeedPresetsValidation:
     """Tests for speed preset values against constraints."""
 
@@ -0,0 +1,184 @@
+"""Tests for the preview clip cache."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.services.preview_cache import PreviewCache
+
+
+def _writer(data: bytes, calls: list[Path] | None = None, delay: float = 0.0):
+    """Build a generate() callback that writes data after an optional delay."""
+
+    async def generate(path: Path) -> None:
+        if calls is not None:
+            calls.append(path)
+        await asyncio.sleep(delay)
+        path.write_bytes(data)
+
+    return generate
+
+
+@pytest.fixture
+def cache(tmp_path) -> PreviewCache:
+    return PreviewCache(tmp_path / "previews", max_entries=4, max_bytes=100)
+
+
+class TestPreviewCache:
+    """Tests for PreviewCache."""
+
+    def test_repeat_requests_reuse_file(self, cache):
+        calls = []
+
+        async def run():
+            first = await cache.acquire("k", ".mp3", _writer(b"abc", calls))
+            cache.release(first)
+            second = await cache.acquire("k", ".mp3", _writer(b"abc", calls))
+            cache.release(second)
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first is second
+        assert len(calls) == 1
+        assert first.path.read_bytes() == b"abc"
+
+    def test_concurrent_requests_share_one_run(self, cache):
+        calls = []
+
+        async def run():
+            return await asyncio.gather(*(
+                cache.acquire("k", ".mp3", _writer(b"abc", calls, delay=0.01))
+                for _ in range(3)
+            ))
+
+        entries = asyncio.run(run())
+        assert len(calls) == 1
+        assert len({id(entry) for entry in entries}) == 1
+        assert entries[0].users == 3
+
+    def test_missing_file_is_regenerated_and_replaced(self, cache):
+        calls = []
+
+        async def run():
+            first = await cache.acquire("k", ".mp3", _writer(b"abc", calls))
+            cache.release(first)
+            first.path.unlink()
+            second = await cache.acquire("k", ".mp3", _writer(b"abc", calls))
+            cache.release(second)
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert len(calls) == 2
+        assert second.path != first.path
+        assert cache.total_bytes == 3
+        assert list(cache.directory.iterdir()) == [second.path]
+
+    def test_evicts_by_total_size(self, cache):
+        async def run():
+            entries = []
+            for key in ("a", "b", "c"):
+                entry = await cache.acquire(key, ".mp3", _writer(b"x" * 40))
+                cache.release(entry)
+                entries.append(entry)
+            return entries
+
+        a, b, c = asyncio.run(run())
+        assert cache.total_bytes == 80
+        assert not a.path.exists()
+        assert b.path.exists() and c.path.exists()
+        assert len(cache) == 2
+
+    def test_evicts_by_entry_count(self, cache):
+        async def run():
+            entries = []
+            for key in range(5):
+                entry = await cache.acquire(key, ".mp3", _writer(b"x"))
+                cache.release(entry)
+                entries.append(entry)
+            return entries
+
+        entries = asyncio.run(run())
+        assert len(cache) == 4
+        assert not entries[0].path.exists()
+        assert sorted(cache.directory.iterdir()) == sorted(e.path for e in entries[1:])
+
+    def test_oversized_preview_is_not_kept(self, cache):
+        async def run():
+            entry = await cache.acquire("big", ".mp3", _writer(b"x" * 500))
+            # Still servable by the request that generated it
+            assert entry.path.exists()
+            cache.release(entry)
+            return entry
+
+        entry = asyncio.run(run())
+        assert not entry.path.exists()
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+    def test_evicted_file_kept_until_released(self, cache):
+        async def run():
+            held = await cache.acquire("a", ".mp3", _writer(b"x" * 60))
+            other = await cache.acquire("b", ".mp3", _writer(b"x" * 60))
+            cache.release(other)
+            # "a" was evicted to make room, but a response still holds it
+            assert held.evicted
+            assert held.path.exists()
+            cache.release(held)
+            return held
+
+        held = asyncio.run(run())
+        assert not held.path.exists()
+
+    def test_failed_generation_reaches_every_waiter(self, cache):
+        async def fail(path: Path) -> None:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("ffmpeg failed")
+
+        async def run():
+            return await asyncio.gather(
+                cache.acquire("k", ".mp3", fail),
+                cache.acquire("k", ".mp3", fail),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(cache) == 0
+        assert not list(cache.directory.iterdir())
+
+    def test_cancelled_waiter_does_not_cancel_shared_run(self, cache):
+        calls = []
+
+        async def run():
+            first = asyncio.ensure_future(
+                cache.acquire("k", ".mp3", _writer(b"abc", calls, delay=0.02))
+            )
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(
+                cache.acquire("k", ".mp3", _writer(b"abc", calls))
+            )
+            await asyncio.sleep(0.005)
+            first.cancel()
+            entry = await second
+            cache.release(entry)
+            return entry
+
+        entry = asyncio.run(run())
+        assert len(calls) == 1
+        assert entry.users == 0
+        assert entry.path.read_bytes() == b"abc"
+
+    def test_clear_empties_directory(self, cache):
+        leftover = cache.new_path(".mp4")
+
+        async def run():
+            entry = await cache.acquire("k", ".mp3", _writer(b"abc"))
+            cache.release(entry)
+
+        asyncio.run(run())
+        cache.clear()
+        assert not leftover.exists()
+        assert not list(cache.directory.iterdir())
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
@@ -0,0 +1,91 @@
+"""Tests that production mode (server.reload off) turns the render caches on."""
+
+import pytest
+from fastapi.templating import Jinja2Templates
+from fastapi.testclient import TestClient
+
+from app import main
+from app.config import AppConfig, config
+from app.routers import audio
+from app.templating import configure_templates
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def no_input_files(monkeypatch):
+    """Make the index page render with an empty input directory."""
+    monkeypatch.setattr(main, "get_input_files", lambda input_dir: [])
+
+
+def test_defaults_are_production():
+    """Without a config.yml (as in the Docker image) dev mode is off."""
+    assert AppConfig().server.reload is False
+
+
+class TestConfigureTemplates:
+    """Tests for configure_templates()."""
+
+    def test_production_precompiles_with_bytecode_cache(self, tmp_path):
+        templates = Jinja2Templates(directory="app/templates")
+        configure_templates(templates, reload=False, bytecode_dir=tmp_path)
+
+        assert templates.env.auto_reload is False
+        assert templates.env.bytecode_cache is not None
+        # Every template was compiled and written to the bytecode cache
+        template_count = len(templates.env.list_templates(extensions=["html"]))
+        assert template_count > 0
+        assert len(list(tmp_path.glob("__jinja2_*.cache"))) == template_count
+
+    def test_dev_mode_reloads_without_cache(self, tmp_path):
+        templates = Jinja2Templates(directory="app/templates")
+        configure_templates(templates, reload=True, bytecode_dir=tmp_path)
+
+        assert templates.env.auto_reload is True
+        assert templates.env.bytecode_cache is None
+        assert not list(tmp_path.iterdir())
+
+
+class TestSliderFormCache:
+    """Tests for the rendered /partials/sliders cache."""
+
+    def test_cached_in_production(self, client, monkeypatch):
+        monkeypatch.setattr(config.server, "reload", False)
+        audio._slider_form_cache.clear()
+
+        first = client.get("/partials/sliders?preset=heavy")
+        assert len(audio._slider_form_cache) == 1
+        second = client.get("/partials/sliders?preset=heavy")
+        assert second.text == first.text
+        audio._slider_form_cache.clear()
+
+    def test_not_cached_in_dev(self, client, monkeypatch):
+        monkeypatch.setattr(config.server, "reload", True)
+        audio._slider_form_cache.clear()
+
+        client.get("/partials/sliders?preset=heavy")
+        assert not audio._slider_form_cache
+
+
+class TestIndexBodyCache:
+    """Tests for the rendered index page cache."""
+
+    def test_cached_in_production(self, client, monkeypatch, no_input_files):
+        monkeypatch.setattr(config.server, "reload", False)
+        main._index_body_cache.clear()
+
+        first = client.get("/")
+        assert len(main._index_body_cache) == 1
+        second = client.get("/")
+        assert second.text == first.text
+        main._index_body_cache.clear()
+
+    def test_not_cached_in_dev(self, client, monkeypatch, no_input_files):
+        monkeypatch.setattr(config.server, "reload", True)
+        main._index_body_cache.clear()
+
+        client.get("/")
+        assert not main._index_body_cache
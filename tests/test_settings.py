@@ -0,0 +1,39 @@
+"""Tests for per-file user settings persistence."""
+
+import yaml
+
+from app.models import CategorySettings
+from app.services.settings import load_user_settings
+
+
+class TestLoadUserSettings:
+    """Tests for load_user_settings()."""
+
+    def test_ignores_unknown_category_keys(self, metadata_dir):
+        """A stored category with an extra key still loads instead of resetting."""
+        metadata = {
+            "settings": {
+                "tunnel": {
+                    "preset": "heavy",
+                    "custom_values": {"delays": "40"},
+                    "legacy_field": True,
+                },
+                "volume": {"preset": "loud"},
+                "active_category": "tunnel",
+            },
+        }
+        (metadata_dir / "clip.yml").write_text(yaml.safe_dump(metadata))
+
+        settings = load_user_settings("clip.mp4")
+
+        assert settings.tunnel == CategorySettings(
+            preset="heavy", custom_values={"delays": "40"}
+        )
+        assert settings.volume.preset == "loud"
+        assert settings.active_category == "tunnel"
+
+    def test_missing_file_returns_defaults(self, metadata_dir):
+        """Files without metadata get default settings."""
+        settings = load_user_settings("missing.mp4")
+        assert settings.tunnel.preset == "none"
+        assert settings.active_tab == "audio"
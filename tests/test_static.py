@@ -0,0 +1,100 @@
+"""Tests for static asset serving (gzip siblings and cache headers)."""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import config
+from app.main import CachedStaticFiles, _accepts_gzip
+
+CSS = b"body { color: red; }\n" * 20
+
+
+@pytest.fixture
+def static_client(tmp_path) -> TestClient:
+    """Client for an app serving a tmp dir with app.css and its .gz sibling."""
+    (tmp_path / "app.css").write_bytes(CSS)
+    (tmp_path / "app.css.gz").write_bytes(gzip.compress(CSS))
+    (tmp_path / "plain.css").write_bytes(CSS)
+
+    static_app = FastAPI()
+    static_app.mount("/static", CachedStaticFiles(directory=tmp_path), name="static")
+    return TestClient(static_app)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        ("gzip", True),
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.8", True),
+        ("GZIP", True),
+        ("x-gzip", True),
+        ("*", True),
+        ("", False),
+        ("deflate, br", False),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, br", False),
+        ("*, gzip;q=0", False),
+        ("*;q=0", False),
+        ("gzip;q=bogus", False),
+    ],
+)
+def test_accepts_gzip(accept_encoding: str, expected: bool):
+    """Accept-Encoding parsing honours q-values and wildcards."""
+    assert _accepts_gzip(accept_encoding) is expected
+
+
+class TestCachedStaticFiles:
+    """Tests for CachedStaticFiles responses."""
+
+    def test_serves_gzip_sibling(self, static_client):
+        """Clients accepting gzip get the precompressed file."""
+        response = static_client.get("/static/app.css", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/css")
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.content == CSS
+
+    def test_gzip_refused_with_zero_q(self, static_client):
+        """gzip;q=0 gets the uncompressed file."""
+        response = static_client.get(
+            "/static/app.css", headers={"Accept-Encoding": "gzip;q=0"}
+        )
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.content == CSS
+
+    def test_falls_back_without_sibling(self, static_client):
+        """Files without a .gz sibling are served as-is."""
+        response = static_client.get("/static/plain.css", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.content == CSS
+
+    def test_direct_gz_request_is_not_found(self, static_client):
+        """The .gz siblings are not served under their own name."""
+        response = static_client.get("/static/app.css.gz")
+        assert response.status_code == 404
+
+    def test_versioned_url_immutable_in_production(self, static_client, monkeypatch):
+        """?v= URLs get a one-year immutable Cache-Control outside dev mode."""
+        monkeypatch.setattr(config.server, "reload", False)
+        response = static_client.get("/static/app.css?v=abc1234")
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    def test_versioned_url_not_cached_in_dev(self, static_client, monkeypatch):
+        """In dev mode assets can change under the same ?v=, so no long cache."""
+        monkeypatch.setattr(config.server, "reload", True)
+        response = static_client.get("/static/app.css?v=abc1234")
+        assert "immutable" not in response.headers.get("cache-control", "")
+
+    def test_unversioned_url_not_immutable(self, static_client, monkeypatch):
+        """Without ?v= there is no long-lived caching."""
+        monkeypatch.setattr(config.server, "reload", False)
+        response = static_client.get("/static/app.css")
+        assert "immutable" not in response.headers.get("cache-control", "")
+
@@ -0,0 +1,73 @@
+"""Tests for the upload endpoint."""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.routers import audio
+from app.services.metadata import invalidate_input_files_cache
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch) -> Path:
+    monkeypatch.setattr(audio, "INPUT_DIR", tmp_path)
+    invalidate_input_files_cache()
+    yield tmp_path
+    invalidate_input_files_cache()
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(main.app)
+
+
+def _upload(client: TestClient, name: str, data: bytes):
+    return client.post("/upload", files={"file": (name, data, "audio/mpeg")})
+
+
+class TestUpload:
+    """Tests for POST /upload."""
+
+    def test_writes_file_and_leaves_no_part(self, client, upload_dir):
+        data = b"\x00\x01" * 300_000
+        response = _upload(client, "clip.mp3", data)
+
+        assert response.status_code == 200
+        assert (upload_dir / "clip.mp3").read_bytes() == data
+        assert [p.name for p in upload_dir.iterdir()] == ["clip.mp3"]
+        assert (upload_dir / "clip.mp3").stat().st_mode & 0o777 == 0o644
+
+    def test_reupload_replaces_file(self, client, upload_dir):
+        _upload(client, "clip.mp3", b"first")
+        _upload(client, "clip.mp3", b"second upload")
+
+        assert (upload_dir / "clip.mp3").read_bytes() == b"second upload"
+        assert [p.name for p in upload_dir.iterdir()] == ["clip.mp3"]
+
+    def test_each_upload_gets_its_own_part_file(self, client, upload_dir, monkeypatch):
+        """Concurrent uploads of one name must not share a temp file."""
+        part_paths = []
+        real_replace = audio.os.replace
+
+        def record_replace(src, dst):
+            part_paths.append(Path(src))
+            real_replace(src, dst)
+
+        monkeypatch.setattr(audio.os, "replace", record_replace)
+        _upload(client, "clip.mp3", b"a")
+        _upload(client, "clip.mp3", b"b")
+
+        assert len(set(part_paths)) == 2
+        assert all(p.parent == upload_dir and p.suffix == ".part" for p in part_paths)
+
+    def test_failed_upload_removes_part(self, client, upload_dir, monkeypatch):
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(audio.os, "replace", fail_replace)
+        response = _upload(client, "clip.mp3", b"data")
+
+        assert "disk full" in response.text
+        assert not list(upload_dir.iterdir())